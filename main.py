@@ -1,13 +1,14 @@
 import argparse
-import json
 import logging
 import sys
 import atexit
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from src.data_validator.config import ValidationConfig
-from src.data_validator.orchestrator import ValidationOrchestrator
-from src.data_validator.db.connection import OracleConnectionPool
+# Heavy imports (pydantic, oracledb) are deferred until after argument parsing
+# so that --help and argument errors return immediately
+if TYPE_CHECKING:
+    from src.data_validator.config import ValidationConfig
 
 # Configure logging
 logging.basicConfig(
@@ -22,13 +23,15 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def load_config(config_file: Path) -> ValidationConfig:
+def load_config(config_file: Path) -> "ValidationConfig":
     """Load configuration from JSON file."""
+    from src.data_validator.config import ValidationConfig, load_env_file
+    
     try:
-        with open(config_file, 'r') as f:
-            config_data = json.load(f)
-        
-        return ValidationConfig(**config_data)
+        load_env_file()
+        with open(config_file, 'rb') as f:
+            # Validate straight from the JSON bytes without building an intermediate dict
+            return ValidationConfig.model_validate_json(f.read())
     except Exception as e:
         logger.error(f"Failed to load configuration: {e}")
         raise
@@ -36,6 +39,8 @@ def load_config(config_file: Path) -> ValidationConfig:
 
 def cleanup_resources():
     """Clean up resources on program exit."""
+    from src.data_validator.db.connection import OracleConnectionPool
+    
     logger.info("Cleaning up database connection pools...")
     try:
         OracleConnectionPool.close_all_pools()
@@ -44,10 +49,22 @@ def cleanup_resources():
         logger.error(f"Error closing connection pools: {e}")
 
 
-def main():
-    # Register cleanup handler to ensure pools are closed on exit
-    atexit.register(cleanup_resources)
+def print_summary(results):
+    """Print a summary of validation results."""
+    print(f"\nValidation completed. Processed {len(results)} tables.")
     
+    for result in results:
+        print(f"\n{result.table_name}:")
+        print(f"  Status: {result.status}")
+        print(f"  Total rows: {'~' if result.total_rows_is_estimate else ''}{result.total_rows:,}")
+        print(f"  Matched: {result.matched_rows:,}")
+        print(f"  Mismatched: {result.mismatched_rows:,}")
+        print(f"  Missing in target: {result.missing_in_target:,}")
+        print(f"  Extra in target: {result.extra_in_target:,}")
+        print(f"  Duration: {result.validation_duration_seconds:.2f} seconds")
+
+
+def main():
     parser = argparse.ArgumentParser(description='Oracle Migration Data Validator')
     parser.add_argument(
         'config',
@@ -64,9 +81,24 @@ def main():
         nargs='+',
         help='Specific tables to validate (overrides config)'
     )
+    parser.add_argument(
+        '--schedule',
+        nargs='?',
+        const=0,
+        type=float,
+        metavar='INTERVAL',
+        help='Keep running and validate each time the run window opens, '
+             'waiting INTERVAL seconds between runs (default: one run per window; '
+             'required without a run window)'
+    )
     
     args = parser.parse_args()
     
+    # Register cleanup handler to ensure pools are closed on exit, including error exits
+    atexit.register(cleanup_resources)
+    
+    from src.data_validator.orchestrator import ValidationAborted, ValidationOrchestrator
+    
     try:
         # Load configuration
         config = load_config(args.config)
@@ -81,35 +113,29 @@ def main():
         # Create and run orchestrator
         orchestrator = ValidationOrchestrator(config)
         
-        if args.resume:
-            results = orchestrator.resume_validations()
-        else:
-            results = orchestrator.run_validation()
+        if args.schedule is not None:
+            orchestrator.run_forever_scheduled(args.schedule)
+            return
         
-        # Print summary
-        print(f"\nValidation completed. Processed {len(results)} tables.")
+        try:
+            if args.resume:
+                results = orchestrator.resume_validations()
+            else:
+                results = orchestrator.run_validation()
+        except ValidationAborted as e:
+            # Report the tables that completed before the run stopped
+            print_summary(e.results)
+            raise
         
-        for result in results:
-            print(f"\n{result.table_name}:")
-            print(f"  Status: {result.status}")
-            print(f"  Total rows: {result.total_rows:,}")
-            print(f"  Matched: {result.matched_rows:,}")
-            print(f"  Mismatched: {result.mismatched_rows:,}")
-            print(f"  Missing in target: {result.missing_in_target:,}")
-            print(f"  Extra in target: {result.extra_in_target:,}")
-            print(f"  Duration: {result.validation_duration_seconds:.2f} seconds")
+        print_summary(results)
         
         # Exit with error if any validations failed
-        failed_count = len([r for r in results if r.status == 'FAILED'])
-        if failed_count > 0:
+        if any(result.status == 'FAILED' for result in results):
             sys.exit(1)
             
     except Exception as e:
         logger.error(f"Validation failed: {e}")
         sys.exit(1)
-    finally:
-        # Ensure connection pools are closed even if we exit due to an error
-        cleanup_resources()
 
 
 if __name__ == "__main__":
@@ -1,11 +1,28 @@
-from typing import Optional, List
-from pydantic import BaseModel, Field, validator
+from typing import Any, Literal, Optional, List
+from pydantic import BaseModel, Field, model_validator
 from datetime import datetime, time
+from functools import cached_property
 import os
-from dotenv import load_dotenv
+import re
 
-# Load environment variables from .env file
-load_dotenv()
+# Matches values of the form ${VAR_NAME}
+_ENV_VAR_PATTERN = re.compile(r'\$\{([^}]+)\}\Z')
+
+
+def _expand_env_var(value: Any) -> Any:
+    """Expand a ${VAR} string from the environment, leaving other values unchanged."""
+    match = _ENV_VAR_PATTERN.match(value) if type(value) is str else None
+    return os.environ.get(match.group(1), value) if match else value
+
+
+def load_env_file():
+    """Load environment variables from a .env file.
+    
+    Set DATA_VALIDATOR_SKIP_DOTENV=1 to rely on the process environment only.
+    """
+    if os.environ.get('DATA_VALIDATOR_SKIP_DOTENV') != '1':
+        from dotenv import load_dotenv
+        load_dotenv()
 
 
 class DatabaseConfig(BaseModel):
@@ -18,17 +35,29 @@ class DatabaseConfig(BaseModel):
     pool_max: int = 10
     pool_increment: int = 1
     
-    @validator('*', pre=True)
-    def expand_env_vars(cls, v):
+    @model_validator(mode='before')
+    @classmethod
+    def expand_env_vars(cls, values: Any) -> Any:
         """Expand environment variables in string values."""
-        if isinstance(v, str) and v.startswith('${') and v.endswith('}'):
-            env_var = v[2:-1]
-            return os.getenv(env_var, v)
-        return v
+        if isinstance(values, dict):
+            return {
+                key: [_expand_env_var(item) for item in value] if type(value) is list else _expand_env_var(value)
+                for key, value in values.items()
+            }
+        return values
     
-    @property
+    @cached_property
     def connection_string(self) -> str:
         return f"{self.username}/{self.password}@{self.host}:{self.port}/{self.service_name}"
+    
+    @cached_property
+    def dsn(self) -> str:
+        return f"{self.host}:{self.port}/{self.service_name}"
+    
+    @cached_property
+    def pool_key(self) -> str:
+        """Unique key identifying the connection pool for this database."""
+        return f"{self.username}@{self.dsn}"
 
 
 
@@ -39,15 +68,29 @@ class TableMapping(BaseModel):
     natural_keys: List[str]
     exclude_columns: List[str] = Field(default_factory=list)
     chunk_size: int = 10000
+    chunks_per_call: int = Field(default=1, ge=1)  # Chunks validated per database round-trip
     where_clause: Optional[str] = None
     incremental_mode: bool = False
     incremental_column: Optional[str] = None  # e.g., "LAST_MODIFIED_DATE"
+    driving_site: Optional[Literal["target", "source"]] = None  # Where Oracle runs the chunk join
+    parallel_degree: Optional[int] = None  # Parallel query degree hinted for both tables
+    hints: Optional[str] = None  # Replaces the generated chunk query hints, e.g. "DRIVING_SITE(t) USE_HASH(t s)"
+    natural_key_index: Optional[str] = None  # Target index on the natural keys; looked up if unset
+    # "hash" compares hashes of the non-LOB columns, grouped so each group's text fits
+    # in a 4000-byte VARCHAR2; a column too wide for one group is compared on its own
+    comparison_mode: Literal["columns", "hash"] = "columns"
+    source_snapshot: bool = False  # Copy the source once into a temporary table and compare locally
 
 
 class RunWindow(BaseModel):
     start_time: time
     end_time: time
     days_of_week: List[int] = Field(default_factory=lambda: list(range(7)))  # 0=Monday, 6=Sunday
+    
+    @cached_property
+    def days_mask(self) -> int:
+        """Allowed days as a bitmask, bit i set when weekday i is allowed."""
+        return sum(1 << day for day in set(self.days_of_week))
 
 
 class ValidationConfig(BaseModel):
@@ -64,6 +107,12 @@ class ValidationConfig(BaseModel):
     mismatch_details_table_name: str = "DATA_VALIDATION_MISMATCH_DETAILS"
     store_mismatch_details: bool = True
     max_mismatch_details: int = 1000  # Maximum number of mismatches to store per table
+    fetch_array_size: int = 2000  # Rows fetched per round-trip for queries without a known result size
+    # Reuse a table's last successful result while its row counts and MAX(incremental_column)
+    # are unchanged on both sides; disabled when not set
+    result_cache_ttl_seconds: Optional[int] = None
+    result_cache_max_entries: int = 256
+    init_probe_ttl_seconds: int = 60  # Skip the connection and DB link probes if they passed this recently
     
     run_window: Optional[RunWindow] = None
     
@@ -100,6 +149,7 @@ class ValidationResult(BaseModel):
     id: int
     table_name: str
     total_rows: int
+    total_rows_is_estimate: bool = False  # total_rows came from optimizer statistics
     matched_rows: int
     mismatched_rows: int
     missing_in_target: int
@@ -109,4 +159,5 @@ class ValidationResult(BaseModel):
     completed_at: datetime
     status: str  # 'SUCCESS', 'FAILED', 'PARTIAL'
     error_message: Optional[str]
+    validation_signature: Optional[str] = None  # Table change signature the result is valid for
     mismatch_details: List[MismatchDetail] = Field(default_factory=list)
\ No newline at end of file
@@ -1,24 +1,38 @@
 import oracledb
 import logging
+import os
+import threading
 import time
-from typing import Optional, Dict, Any, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 
 from ..config import DatabaseConfig
 
 logger = logging.getLogger(__name__)
 
-# Initialize Oracle client if needed
-try:
+# Tag applied to pooled sessions once their NLS settings have been configured
+SESSION_TAG = "NLS_SET"
+
+# Connection acquisitions slower than this are logged as warnings; 0 disables the timing
+SLOW_ACQUISITION_SECONDS = 1.0
+
+# Maximum number of distinct statements whose result column names are cached
+ROW_FACTORY_CACHE_SIZE = 256
+
+# python-oracledb runs in thin mode unless thick mode is requested explicitly.
+# Thick mode needs Oracle Instant Client and is only required for features
+# thin mode does not support (e.g. Advanced Queuing, some native encryption setups).
+if os.environ.get('ORACLEDB_THICK') == '1':
     oracledb.init_oracle_client()
-    logger.info("Oracle client initialized")
-except Exception as e:
-    logger.info(f"Oracle client initialization skipped: {e}")
+    logger.info("Oracle client initialized (thick mode)")
 
 
 class OracleConnectionPool:
     """Manages Oracle connection pools for both source and target databases."""
     _pools: Dict[str, oracledb.ConnectionPool] = {}
+    # Guards pool creation and removal so concurrent callers never create duplicate pools
+    _lock = threading.RLock()
     
     @classmethod
     def get_pool(cls, db_config: DatabaseConfig, pool_min: int = 2, pool_max: int = 10, 
@@ -37,94 +51,116 @@ class OracleConnectionPool:
             Connection pool for the database
         """
         # Create a unique key for this database configuration
-        pool_key = f"{db_config.username}@{db_config.host}:{db_config.port}/{db_config.service_name}"
+        pool_key = db_config.pool_key
         
-        # Return existing pool if it exists and is still open
+        # Return the cached pool; stale sessions are detected by the pool's
+        # ping_interval and broken pools are recreated in get_connection
         if pool_key in cls._pools:
-            pool = cls._pools[pool_key]
+            return cls._pools[pool_key]
+        
+        with cls._lock:
+            # Another thread may have created the pool while we waited for the lock
+            if pool_key in cls._pools:
+                return cls._pools[pool_key]
+            
+            # Create a new pool
+            # First try with direct DSN string
+            dsn = db_config.dsn
+            logger.info(f"Creating connection pool for {dsn} with min={pool_min}, max={pool_max}")
+        
             try:
-                # Test if pool is still valid
-                with pool.acquire() as conn:
-                    with conn.cursor() as cursor:
-                        cursor.execute("SELECT 1 FROM DUAL")
-                return pool
+                pool = oracledb.create_pool(
+                    user=db_config.username,
+                    password=db_config.password,
+                    dsn=dsn,
+                    min=pool_min,
+                    max=pool_max,
+                    increment=pool_increment,
+                    getmode=oracledb.POOL_GETMODE_WAIT,
+                    wait_timeout=timeout,
+                    ping_interval=60,
+                    stmtcachesize=64,
+                    session_callback=cls._configure_session
+                )
             except Exception as e:
-                logger.warning(f"Existing pool {pool_key} is invalid, creating new one: {e}")
-                # If we get here, the pool is invalid, so we'll create a new one
-                if pool_key in cls._pools:
-                    try:
-                        cls._pools[pool_key].close(force=True)
-                    except Exception as e2:
-                        logger.warning(f"Error closing pool {pool_key}: {e2}")
-                    del cls._pools[pool_key]
-        
-        # Create a new pool
-        # First try with direct DSN string
-        dsn = f"{db_config.host}:{db_config.port}/{db_config.service_name}"
-        logger.info(f"Creating connection pool for {dsn} with min={pool_min}, max={pool_max}")
+                logger.warning(f"Direct DSN connection pool failed: {e}, trying makedsn...")
+                # Try with makedsn
+                dsn = oracledb.makedsn(
+                    db_config.host, 
+                    db_config.port, 
+                    service_name=db_config.service_name
+                )
+                pool = oracledb.create_pool(
+                    user=db_config.username,
+                    password=db_config.password,
+                    dsn=dsn,
+                    min=pool_min,
+                    max=pool_max,
+                    increment=pool_increment,
+                    getmode=oracledb.POOL_GETMODE_WAIT,
+                    wait_timeout=timeout,
+                    ping_interval=60,
+                    stmtcachesize=64,
+                    session_callback=cls._configure_session
+                )
         
+            # Store pool for future use
+            cls._pools[pool_key] = pool
+            logger.info(f"Created connection pool for {pool_key} with min={pool_min}, max={pool_max}")
+            return pool
+    
+    @classmethod
+    def invalidate_pool(cls, db_config: DatabaseConfig, pool: oracledb.ConnectionPool):
+        """Drop a broken pool so the next get_pool call creates a fresh one."""
+        pool_key = db_config.pool_key
+        with cls._lock:
+            if cls._pools.get(pool_key) is pool:
+                del cls._pools[pool_key]
         try:
-            pool = oracledb.create_pool(
-                user=db_config.username,
-                password=db_config.password,
-                dsn=dsn,
-                min=pool_min,
-                max=pool_max,
-                increment=pool_increment,
-                getmode=oracledb.POOL_GETMODE_WAIT,
-                wait_timeout=timeout,
-                session_callback=cls._configure_session
-            )
+            pool.close(force=True)
         except Exception as e:
-            logger.warning(f"Direct DSN connection pool failed: {e}, trying makedsn...")
-            # Try with makedsn
-            dsn = oracledb.makedsn(
-                db_config.host, 
-                db_config.port, 
-                service_name=db_config.service_name
-            )
-            pool = oracledb.create_pool(
-                user=db_config.username,
-                password=db_config.password,
-                dsn=dsn,
-                min=pool_min,
-                max=pool_max,
-                increment=pool_increment,
-                getmode=oracledb.POOL_GETMODE_WAIT,
-                wait_timeout=timeout,
-                session_callback=cls._configure_session
-            )
-        
-        # Store pool for future use
-        cls._pools[pool_key] = pool
-        logger.info(f"Created connection pool for {pool_key} with min={pool_min}, max={pool_max}")
-        return pool
+            logger.warning(f"Error closing pool {pool_key}: {e}")
     
     @staticmethod
     def _configure_session(connection, requested_tag=None, actual_tag=None):
-        """Configure session settings for connections from the pool."""
+        """Configure session settings for connections from the pool.
+        
+        Sessions are tagged once configured, so the ALTER SESSION statements only
+        run the first time a physical session is handed out.
+        """
+        if actual_tag == SESSION_TAG:
+            return
         with connection.cursor() as cursor:
             # Configure session settings
             cursor.execute("ALTER SESSION SET NLS_DATE_FORMAT = 'YYYY-MM-DD HH24:MI:SS'")
             cursor.execute("ALTER SESSION SET NLS_TIMESTAMP_FORMAT = 'YYYY-MM-DD HH24:MI:SS.FF'")
             # Add other session settings as needed
+        connection.tag = SESSION_TAG
     
     @classmethod
     def close_all_pools(cls):
-        """Close all connection pools."""
-        for pool_key, pool in list(cls._pools.items()):
-            try:
-                logger.info(f"Closing connection pool for {pool_key}")
-                pool.close(force=False)  # Wait for connections to be returned
-                del cls._pools[pool_key]
-            except Exception as e:
-                logger.warning(f"Error closing pool {pool_key}: {e}")
-                # Try force close if normal close fails
-                try:
-                    pool.close(force=True)
-                    del cls._pools[pool_key]
-                except Exception as e2:
-                    logger.error(f"Error force closing pool {pool_key}: {e2}")
+        """Close all connection pools. Safe to call more than once."""
+        if not cls._pools:
+            return
+        
+        # Detach the pools first so a repeated call never closes them twice
+        with cls._lock:
+            pools = list(cls._pools.items())
+            cls._pools.clear()
+        
+        # Close the pools in parallel; at shutdown there is no need to wait for
+        # outstanding connections, so a single forced close per pool is enough
+        with ThreadPoolExecutor(max_workers=len(pools)) as executor:
+            list(executor.map(cls._force_close, pools))
+    
+    @staticmethod
+    def _force_close(entry: Tuple[str, oracledb.ConnectionPool]):
+        pool_key, pool = entry
+        try:
+            logger.info(f"Closing connection pool for {pool_key}")
+            pool.close(force=True)
+        except Exception as e:
+            logger.error(f"Error closing pool {pool_key}: {e}")
 
 
 class OracleConnectionManager:
@@ -135,37 +171,73 @@ class OracleConnectionManager:
     - The DB link should point to the source database
     - Validation queries are executed from the target database
     """
-    def __init__(self, config: DatabaseConfig, pool_min: int = 2, pool_max: int = 10, pool_increment: int = 1):
+    def __init__(self, config: DatabaseConfig, pool_min: int = 2, pool_max: int = 10, pool_increment: int = 1,
+                 arraysize: int = 1000, prefetchrows: int = 1000):
         self.config = config
         self.pool_min = pool_min
         self.pool_max = pool_max
         self.pool_increment = pool_increment
-        self._pool = None
+        # Default fetch tuning for queries; callers can override per query
+        self.arraysize = arraysize
+        self.prefetchrows = prefetchrows
+        # Row factories keyed by SQL text, so column names are read once per statement
+        self._row_factories: Dict[str, Callable[..., Dict[str, Any]]] = {}
+        self._pool = self._create_pool()
+        
+    def _create_pool(self) -> oracledb.ConnectionPool:
+        return OracleConnectionPool.get_pool(
+            self.config, 
+            self.pool_min, 
+            self.pool_max, 
+            self.pool_increment
+        )
         
     @property
     def pool(self) -> oracledb.ConnectionPool:
         """Get the connection pool for this connection manager."""
-        if not self._pool:
-            self._pool = OracleConnectionPool.get_pool(
-                self.config, 
-                self.pool_min, 
-                self.pool_max, 
-                self.pool_increment
-            )
         return self._pool
+    
+    def _acquire(self):
+        """Acquire a connection, recreating the pool once if it has become unusable."""
+        try:
+            return self._pool.acquire(tag=SESSION_TAG, matchanytag=True)
+        except oracledb.DatabaseError as e:
+            logger.warning(f"Connection pool is invalid, creating new one: {e}")
+            OracleConnectionPool.invalidate_pool(self.config, self._pool)
+            self._pool = self._create_pool()
+            return self._pool.acquire(tag=SESSION_TAG, matchanytag=True)
+        
+    def acquire(self):
+        """Acquire a connection to hold across many calls; return it with release()."""
+        return self._acquire()
+    
+    def release(self, connection):
+        """Return a connection obtained from acquire() to the pool."""
+        try:
+            self.pool.release(connection)
+        except Exception as e:
+            logger.warning(f"Error returning connection to pool: {e}")
+            try:
+                connection.close()
+            except Exception:
+                pass
         
     @contextmanager
     def get_connection(self):
         """Context manager for database connections from the pool."""
         connection = None
-        start_time = time.time()
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        timed = debug_enabled or SLOW_ACQUISITION_SECONDS
+        start_time = time.time() if timed else 0.0
         
         try:
-            connection = self.pool.acquire()
-            acquisition_time = time.time() - start_time
-            if acquisition_time > 1.0:  # Log if it took more than 1 second to get a connection
-                logger.warning(f"Slow connection acquisition: {acquisition_time:.2f}s")
-            logger.debug(f"Acquired connection from pool in {acquisition_time:.4f}s")
+            connection = self._acquire()
+            if timed:
+                acquisition_time = time.time() - start_time
+                if SLOW_ACQUISITION_SECONDS and acquisition_time > SLOW_ACQUISITION_SECONDS:
+                    logger.warning(f"Slow connection acquisition: {acquisition_time:.2f}s")
+                if debug_enabled:
+                    logger.debug(f"Acquired connection from pool in {acquisition_time:.4f}s")
             yield connection
         except Exception as e:
             logger.error(f"Failed to get connection from pool: {e}")
@@ -175,7 +247,8 @@ class OracleConnectionManager:
                 try:
                     # Return connection to the pool
                     self.pool.release(connection)
-                    logger.debug(f"Released connection back to pool, took {time.time() - start_time:.4f}s total")
+                    if debug_enabled:
+                        logger.debug(f"Released connection back to pool, took {time.time() - start_time:.4f}s total")
                 except Exception as e:
                     logger.warning(f"Error returning connection to pool: {e}")
                     # If we can't return it to the pool, try to close it
@@ -184,36 +257,147 @@ class OracleConnectionManager:
                     except:
                         pass
     
+    def new_cursor(self, connection):
+        """Open a cursor on connection with the manager's default fetch tuning."""
+        cursor = connection.cursor()
+        cursor.arraysize = self.arraysize
+        # One more than arraysize so a result that fits is fetched in one round-trip
+        cursor.prefetchrows = self.prefetchrows + 1
+        return cursor
+    
     @contextmanager
     def get_cursor(self, connection=None):
         """Get a cursor, either from provided connection or new connection from pool."""
         if connection:
-            cursor = connection.cursor()
+            cursor = self.new_cursor(connection)
             try:
                 yield cursor
             finally:
                 cursor.close()
         else:
             with self.get_connection() as conn:
-                with conn.cursor() as cursor:
+                with self.new_cursor(conn) as cursor:
                     yield cursor
     
-    def execute_query(self, query: str, params: Dict[str, Any] = None, fetch_all: bool = True):
-        """Execute a query and return results."""
-        with self.get_connection() as connection:
+    @contextmanager
+    def connection_scope(self, connection=None):
+        """Yield the given connection, or one acquired from the pool for the block."""
+        if connection is not None:
+            yield connection
+        else:
+            with self.get_connection() as connection:
+                yield connection
+    
+    def execute_query(self, query: str, params: Union[Dict[str, Any], Sequence[Any]] = None, fetch_all: bool = True,
+                      arraysize: Optional[int] = None, prefetchrows: Optional[int] = None, connection=None,
+                      input_sizes: Optional[Dict[str, Any]] = None):
+        """Execute a query and return results.
+        
+        arraysize and prefetchrows control how many rows are fetched per round-trip.
+        Callers that know the result size should pass it as arraysize; prefetchrows
+        then defaults to the same value. Both otherwise default to the values
+        configured on the connection manager. If connection is given the query
+        runs on it instead of a connection acquired from the pool. input_sizes
+        maps bind names to the types passed to setinputsizes.
+        """
+        with self.connection_scope(connection) as connection:
             with self.get_cursor(connection) as cursor:
+                cursor.arraysize = arraysize or self.arraysize
+                # prefetchrows one larger than the expected rows avoids an extra round-trip
+                # to detect the end of the result set
+                cursor.prefetchrows = (prefetchrows or arraysize or self.prefetchrows) + 1
+                if input_sizes:
+                    cursor.setinputsizes(**input_sizes)
                 if params:
                     cursor.execute(query, params)
                 else:
                     cursor.execute(query)
                 
                 if fetch_all:
-                    columns = [col[0] for col in cursor.description]
-                    rows = cursor.fetchall()
-                    return [dict(zip(columns, row)) for row in rows]
+                    # Build the dicts as rows are fetched instead of a second pass over the rows
+                    cursor.rowfactory = self._row_factory(query, cursor.description)
+                    return cursor.fetchall()
                 else:
                     return cursor
     
+    def execute_query_rows(self, query: str, params: Union[Dict[str, Any], Sequence[Any]] = None,
+                           arraysize: Optional[int] = None,
+                           prefetchrows: Optional[int] = None,
+                           connection=None) -> Tuple[List[str], List[tuple]]:
+        """Execute a query and return its column names and rows as plain tuples.
+        
+        Cheaper than execute_query for large results whose columns the caller
+        already knows by position.
+        """
+        with self.connection_scope(connection) as connection:
+            with self.get_cursor(connection) as cursor:
+                cursor.arraysize = arraysize or self.arraysize
+                cursor.prefetchrows = (prefetchrows or arraysize or self.prefetchrows) + 1
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+                columns = [col[0] for col in cursor.description]
+                return columns, cursor.fetchall()
+    
+    def _row_factory(self, query: str, description) -> Callable[..., Dict[str, Any]]:
+        """Return a dict row factory for a query, reusing the one built for the same SQL text."""
+        row_factory = self._row_factories.get(query)
+        # A cached factory is only reused while the result shape is unchanged
+        if row_factory is None or row_factory.column_count != len(description):
+            columns = tuple(col[0] for col in description)
+            row_factory = lambda *row, _columns=columns: dict(zip(_columns, row))
+            row_factory.column_count = len(columns)
+            if len(self._row_factories) >= ROW_FACTORY_CACHE_SIZE:
+                # Evict the oldest entry
+                self._row_factories.pop(next(iter(self._row_factories)), None)
+            self._row_factories[query] = row_factory
+        return row_factory
+    
+    def execute_many(self, statement: str, seq_of_params: Sequence[Union[Dict[str, Any], Sequence[Any]]],
+                     batcherrors: bool = False, call_timeout: Optional[int] = None,
+                     input_sizes: Optional[Sequence[Any]] = None, batch_size: Optional[int] = None,
+                     connection=None) -> List[Any]:
+        """Execute a DML statement for each set of bind parameters in as few round-trips as possible.
+        
+        Rows are sent batch_size at a time (all at once by default) on a single cursor
+        and committed once at the end. input_sizes is passed to setinputsizes so bind
+        types are declared once instead of inferred per batch. With batcherrors enabled,
+        rows that fail are skipped instead of aborting the batch and their errors are
+        returned, with offsets relative to seq_of_params. call_timeout (milliseconds)
+        bounds each round-trip for this call only. If connection is given it is used
+        instead of one acquired from the pool.
+        """
+        if not seq_of_params:
+            return []
+        if connection is None:
+            with self.get_connection() as connection:
+                return self._execute_many(connection, statement, seq_of_params, batcherrors,
+                                          call_timeout, input_sizes, batch_size)
+        return self._execute_many(connection, statement, seq_of_params, batcherrors,
+                                  call_timeout, input_sizes, batch_size)
+    
+    def _execute_many(self, connection, statement, seq_of_params, batcherrors, call_timeout,
+                      input_sizes, batch_size) -> List[Any]:
+        batch_size = batch_size or len(seq_of_params)
+        previous_timeout = connection.call_timeout
+        if call_timeout is not None:
+            connection.call_timeout = call_timeout
+        try:
+            errors = []
+            with self.get_cursor(connection) as cursor:
+                if input_sizes:
+                    cursor.setinputsizes(*input_sizes)
+                for start in range(0, len(seq_of_params), batch_size):
+                    cursor.executemany(statement, seq_of_params[start:start + batch_size],
+                                       batcherrors=batcherrors)
+                    if batcherrors:
+                        errors.extend((start + error.offset, error) for error in cursor.getbatcherrors())
+            connection.commit()
+            return errors
+        finally:
+            connection.call_timeout = previous_timeout
+    
     def execute_ddl(self, statement: str):
         """Execute DDL statement."""
         with self.get_connection() as connection:
@@ -222,12 +406,14 @@ class OracleConnectionManager:
                 connection.commit()
                 logger.info(f"Executed DDL: {statement[:100]}...")
     
-    def test_connection(self) -> bool:
-        """Test if database connection is working."""
+    def test_connection(self, query: str = "SELECT 1 FROM DUAL") -> bool:
+        """Test if database connection is working by running a one-row probe query."""
         try:
             with self.get_connection() as connection:
                 with self.get_cursor(connection) as cursor:
-                    cursor.execute("SELECT 1 FROM DUAL")
+                    cursor.arraysize = 1
+                    cursor.prefetchrows = 2
+                    cursor.execute(query)
                     result = cursor.fetchone()
                     return result[0] == 1
         except Exception as e:
@@ -1,12 +1,144 @@
 import logging
-from datetime import datetime
-from typing import List, Optional
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+import oracledb
 
 from ..config import ValidationProgress, ValidationResult, MismatchDetail, DatabaseConfig
 from .connection import OracleConnectionManager
 
 logger = logging.getLogger(__name__)
 
+# Rows per executemany call when saving mismatch details
+MISMATCH_DETAIL_BATCH_SIZE = 5000
+
+# Bind types for the mismatch detail insert, in column order. The CLOB columns
+# (None here) are sized per call by _mismatch_detail_input_sizes
+MISMATCH_DETAIL_INPUT_SIZES = (
+    None,  # validation_id
+    100,   # table_name
+    20,    # mismatch_type
+    None,  # key_values
+    100,   # column_name
+    None,  # source_value
+    None,  # target_value
+)
+MISMATCH_DETAIL_CLOB_COLUMNS = (3, 5, 6)
+
+# Longest string, in bytes, that can be bound as VARCHAR2 into a CLOB column
+MAX_VARCHAR_BIND_BYTES = 4000
+
+# Most mismatch details saved in the same PL/SQL call as their result; this is
+# the element limit of SYS.ODCIVARCHAR2LIST
+MAX_FUSED_DETAILS = 32767
+
+
+def _fits_varchar_bind(value: Optional[str]) -> bool:
+    # A character takes at most 4 bytes in UTF-8, so short strings need no encoding
+    return (value is None or len(value) <= MAX_VARCHAR_BIND_BYTES // 4
+            or len(value.encode('utf-8')) <= MAX_VARCHAR_BIND_BYTES)
+
+
+def _mismatch_detail_input_sizes(rows: List[tuple]) -> List:
+    """Bind each CLOB column as VARCHAR2 unless one of its values is too long for it.
+    
+    Oracle converts VARCHAR2 binds into CLOB columns implicitly, which avoids a
+    temporary LOB per value; a column only falls back to CLOB binding when needed.
+    """
+    input_sizes = list(MISMATCH_DETAIL_INPUT_SIZES)
+    for column in MISMATCH_DETAIL_CLOB_COLUMNS:
+        if all(_fits_varchar_bind(row[column]) for row in rows):
+            input_sizes[column] = MAX_VARCHAR_BIND_BYTES
+        else:
+            input_sizes[column] = oracledb.DB_TYPE_CLOB
+    return input_sizes
+
+# Oracle's limit on the number of expressions in an IN-list
+MAX_IN_LIST_SIZE = 1000
+
+# Select list of a results row, in the order _result_from_row unpacks it
+RESULT_COLUMNS = """id, table_name, NVL(total_rows, 0), NVL(matched_rows, 0), NVL(mismatched_rows, 0),
+               NVL(missing_in_target, 0), NVL(extra_in_target, 0),
+               NVL(validation_duration_seconds, 0), started_at, completed_at, status, error_message,
+               validation_signature, NVL(total_rows_is_estimate, 0)"""
+
+# Columns added to the results table after its first release, with their types;
+# initialize_tables adds them to existing tables
+RESULTS_TABLE_ADDED_COLUMNS = (
+    ("validation_signature", "VARCHAR2(64)"),
+    ("total_rows_is_estimate", "NUMBER(1) DEFAULT 0"),
+)
+
+# Seconds between background flushes of coalesced progress updates
+PROGRESS_FLUSH_INTERVAL = 2.0
+
+ProgressState = Tuple[int, Optional[str], str]
+
+
+class _ProgressWriter(threading.Thread):
+    """Background writer for progress updates.
+    
+    Only the latest state per progress id is kept; pending states are written
+    together every flush interval. Progress is advisory, so a failed flush is
+    logged rather than raised.
+    """
+    def __init__(self, write: Callable[[Dict[int, ProgressState]], None],
+                 interval: float = PROGRESS_FLUSH_INTERVAL):
+        super().__init__(name="progress-writer", daemon=True)
+        self._write = write
+        self._interval = interval
+        self._pending: Dict[int, ProgressState] = {}
+        # Last state written per progress id, guarded by _flush_lock
+        self._last_written: Dict[int, ProgressState] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+    
+    def submit(self, progress_id: int, state: ProgressState):
+        """Record the latest state for progress_id without blocking on the database."""
+        with self._lock:
+            self._pending[progress_id] = state
+    
+    def flush(self, progress_id: Optional[int] = None):
+        """Write pending states now, either all of them or only the one for progress_id.
+        
+        States identical to the last one written for the same id are skipped.
+        Flushes are serialised, so once this returns no earlier state for the id
+        can still be in flight.
+        """
+        with self._flush_lock:
+            with self._lock:
+                if progress_id is None:
+                    pending, self._pending = self._pending, {}
+                elif progress_id in self._pending:
+                    pending = {progress_id: self._pending.pop(progress_id)}
+                else:
+                    return
+            pending = {
+                pending_id: state for pending_id, state in pending.items()
+                if self._last_written.get(pending_id) != state
+            }
+            if not pending:
+                return
+            try:
+                self._write(pending)
+                self._last_written.update(pending)
+            except Exception as e:
+                logger.warning(f"Failed to write progress for {len(pending)} validation(s): {e}")
+    
+    def finish(self, progress_id: int):
+        """Write any pending state for progress_id and stop tracking it."""
+        self.flush(progress_id)
+        with self._flush_lock:
+            self._last_written.pop(progress_id, None)
+    
+    def run(self):
+        while True:
+            time.sleep(self._interval)
+            self.flush()
+
 
 class ValidationRepository:
     """Repository for storing validation progress and results.
@@ -19,6 +151,52 @@ class ValidationRepository:
         self.progress_table = progress_table
         self.results_table = results_table
         self.mismatch_details_table = mismatch_details_table
+        # Writes share one pooled connection held for the repository's lifetime
+        # instead of acquiring and releasing one per call
+        self._connection = None
+        self._connection_depth = 0
+        self._connection_lock = threading.RLock()
+        # Open cursors on the write connection keyed by SQL text, so the hot DML
+        # statements are parsed once and then only re-executed with new binds
+        self._cursors = {}
+        # SYS.ODCIVARCHAR2LIST type on the write connection, looked up once
+        self._varchar_list_type = None
+        # Chunk progress is written asynchronously off the validation hot path
+        self._progress_writer: Optional[_ProgressWriter] = None
+        self._progress_writer_lock = threading.Lock()
+    
+    @contextmanager
+    def _write_connection(self):
+        """Yield the repository's write connection, acquiring it on first use.
+        
+        Callers are serialised on the connection. If a database error escapes the
+        outermost caller the connection is returned to the pool and a fresh one is
+        acquired on the next write.
+        """
+        with self._connection_lock:
+            if self._connection is None:
+                self._connection = self.db_manager.acquire()
+            self._connection_depth += 1
+            try:
+                yield self._connection
+            except oracledb.DatabaseError:
+                if self._connection_depth == 1:
+                    connection, self._connection = self._connection, None
+                    self._cursors.clear()
+                    self._varchar_list_type = None
+                    self.db_manager.release(connection)
+                raise
+            finally:
+                self._connection_depth -= 1
+    
+    def _cached_cursor(self, connection, statement: str):
+        """Return the open cursor for statement on the write connection, creating it once."""
+        cursor = self._cursors.get(statement)
+        if cursor is None:
+            cursor = self.db_manager.new_cursor(connection)
+            cursor.prepare(statement)
+            self._cursors[statement] = cursor
+        return cursor
         
     def initialize_tables(self):
         """Create progress, results, and mismatch details tables if they don't exist."""
@@ -51,7 +229,9 @@ class ValidationRepository:
             started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             completed_at TIMESTAMP,
             status VARCHAR2(20) NOT NULL,
-            error_message VARCHAR2(4000)
+            error_message VARCHAR2(4000),
+            validation_signature VARCHAR2(64),
+            total_rows_is_estimate NUMBER(1) DEFAULT 0
         )
         """
         
@@ -78,17 +258,51 @@ class ValidationRepository:
             (self.mismatch_details_table, mismatch_details_ddl)
         ]
         
+        # Look up all three tables in one round-trip and create only the missing ones
+        check_query = """
+        SELECT table_name FROM user_tables
+        WHERE table_name IN (UPPER(:1), UPPER(:2), UPPER(:3))
+        """
+        result = self.db_manager.execute_query(check_query, [name for name, _ in tables_ddl],
+                                              arraysize=len(tables_ddl))
+        existing_tables = {row['TABLE_NAME'] for row in result}
+        
         for table_name, ddl in tables_ddl:
-            check_query = f"""
-            SELECT COUNT(*) FROM user_tables WHERE table_name = UPPER(:table_name)
-            """
-            result = self.db_manager.execute_query(check_query, {"table_name": table_name})
-            
-            if result[0]['COUNT(*)'] == 0:
+            if table_name.upper() not in existing_tables:
                 logger.info(f"Creating table {table_name}")
                 self.db_manager.execute_ddl(ddl)
             else:
                 logger.info(f"Table {table_name} already exists")
+        
+        if self.results_table.upper() in existing_tables:
+            self._add_missing_columns(self.results_table, RESULTS_TABLE_ADDED_COLUMNS)
+        
+        # Covering index for the latest-progress lookups, so they are answered by
+        # an index range scan instead of a sort over the table's rows
+        progress_index = f"{self.progress_table}_IX"
+        check_query = """
+        SELECT COUNT(*) AS cnt FROM user_indexes WHERE index_name = UPPER(:index_name)
+        """
+        result = self.db_manager.execute_query(check_query, {"index_name": progress_index}, arraysize=1)
+        
+        if result[0]['CNT'] == 0:
+            logger.info(f"Creating index {progress_index}")
+            self.db_manager.execute_ddl(
+                f"CREATE INDEX {progress_index} ON {self.progress_table} (table_name, started_at DESC, status, id)"
+            )
+    
+    def _add_missing_columns(self, table_name: str, columns: Tuple[Tuple[str, str], ...]):
+        """Add any of the given (name, type) columns that an existing table lacks."""
+        check_query = """
+        SELECT column_name FROM user_tab_columns WHERE table_name = UPPER(:table_name)
+        """
+        result = self.db_manager.execute_query(check_query, {"table_name": table_name})
+        existing_columns = {row['COLUMN_NAME'] for row in result}
+        
+        for column_name, column_type in columns:
+            if column_name.upper() not in existing_columns:
+                logger.info(f"Adding column {column_name} to {table_name}")
+                self.db_manager.execute_ddl(f"ALTER TABLE {table_name} ADD ({column_name} {column_type})")
     
     def create_progress_entry(self, table_name: str, total_rows: int = 0) -> int:
         """Create a new progress entry and return its ID."""
@@ -99,21 +313,67 @@ class ValidationRepository:
         RETURNING id INTO :id
         """
         
-        with self.db_manager.get_connection() as connection:
+        with self._write_connection() as connection:
+            cursor = self._cached_cursor(connection, insert_query)
+            id_var = cursor.var(int)
+            cursor.execute(insert_query, {
+                "table_name": table_name,
+                "total_rows": total_rows,
+                "id": id_var
+            })
+            connection.commit()
+            return id_var.getvalue()[0]
+    
+    def create_progress_entries(self, table_names: List[str], total_rows: int = 0) -> List[int]:
+        """Create progress entries for several tables in one round-trip and return their IDs.
+        
+        The IDs are returned in the same order as table_names.
+        """
+        if not table_names:
+            return []
+        
+        insert_query = f"""
+        INSERT INTO {self.progress_table} 
+        (table_name, status, total_rows, processed_rows, started_at, updated_at)
+        VALUES (:1, 'IN_PROGRESS', :2, 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+        RETURNING id INTO :3
+        """
+        
+        with self._write_connection() as connection:
             with self.db_manager.get_cursor(connection) as cursor:
-                id_var = cursor.var(int)
-                cursor.execute(insert_query, {
-                    "table_name": table_name,
-                    "total_rows": total_rows,
-                    "id": id_var
-                })
+                id_var = cursor.var(int, arraysize=len(table_names))
+                cursor.setinputsizes(None, None, id_var)
+                cursor.executemany(insert_query, [(table_name, total_rows) for table_name in table_names])
                 connection.commit()
-                return id_var.getvalue()[0]
+                return [id_var.getvalue(i)[0] for i in range(len(table_names))]
     
     def update_progress(self, progress_id: int, processed_rows: int, 
                        last_processed_key: Optional[str] = None,
                        status: str = "IN_PROGRESS"):
-        """Update progress for a validation."""
+        """Queue a progress update for a validation.
+        
+        Updates are coalesced per progress id and written in the background every
+        PROGRESS_FLUSH_INTERVAL seconds; complete_progress writes any pending
+        update for its id first.
+        """
+        self._get_progress_writer().submit(progress_id, (processed_rows, last_processed_key, status))
+    
+    def flush_progress(self):
+        """Write all queued progress updates now."""
+        if self._progress_writer is not None:
+            self._progress_writer.flush()
+    
+    def _get_progress_writer(self) -> _ProgressWriter:
+        if self._progress_writer is None:
+            with self._progress_writer_lock:
+                if self._progress_writer is None:
+                    writer = _ProgressWriter(self._write_progress)
+                    writer.start()
+                    self._progress_writer = writer
+        return self._progress_writer
+    
+    def _write_progress(self, pending: Dict[int, ProgressState]):
+        """Apply coalesced progress updates with one array-bound UPDATE and one commit."""
         update_query = f"""
         UPDATE {self.progress_table}
         SET processed_rows = :processed_rows,
@@ -123,19 +383,28 @@ class ValidationRepository:
         WHERE id = :id
         """
         
-        with self.db_manager.get_connection() as connection:
-            with self.db_manager.get_cursor(connection) as cursor:
-                cursor.execute(update_query, {
-                    "processed_rows": processed_rows,
-                    "last_processed_key": last_processed_key,
-                    "status": status,
-                    "id": progress_id
-                })
-                connection.commit()
+        # Timestamps stay on the database clock, like started_at in the INSERTs
+        params_list = [
+            {
+                "processed_rows": processed_rows,
+                "last_processed_key": last_processed_key,
+                "status": status,
+                "id": progress_id
+            }
+            for progress_id, (processed_rows, last_processed_key, status) in pending.items()
+        ]
+        
+        with self._write_connection() as connection:
+            cursor = self._cached_cursor(connection, update_query)
+            cursor.executemany(update_query, params_list)
+            connection.commit()
     
     def complete_progress(self, progress_id: int, status: str = "COMPLETED", 
                          error_message: Optional[str] = None):
         """Mark a progress entry as completed."""
+        if self._progress_writer is not None:
+            self._progress_writer.finish(progress_id)
+        
         update_query = f"""
         UPDATE {self.progress_table}
         SET status = :status,
@@ -145,14 +414,14 @@ class ValidationRepository:
         WHERE id = :id
         """
         
-        with self.db_manager.get_connection() as connection:
-            with self.db_manager.get_cursor(connection) as cursor:
-                cursor.execute(update_query, {
-                    "status": status,
-                    "error_message": error_message,
-                    "id": progress_id
-                })
-                connection.commit()
+        with self._write_connection() as connection:
+            cursor = self._cached_cursor(connection, update_query)
+            cursor.execute(update_query, {
+                "status": status,
+                "error_message": error_message,
+                "id": progress_id
+            })
+            connection.commit()
     
     def get_latest_progress(self, table_name: str) -> Optional[ValidationProgress]:
         """Get the latest progress entry for a table."""
@@ -163,7 +432,7 @@ class ValidationRepository:
         FETCH FIRST 1 ROW ONLY
         """
         
-        results = self.db_manager.execute_query(query, {"table_name": table_name})
+        results = self.db_manager.execute_query(query, {"table_name": table_name}, arraysize=1)
         if results:
             row = results[0]
             return ValidationProgress(
@@ -180,46 +449,197 @@ class ValidationRepository:
             )
         return None
     
+    def get_latest_progress_bulk(self, table_names: List[str]) -> Dict[str, ValidationProgress]:
+        """Get the latest progress entry for each of several tables in one query.
+        
+        Returns a dict keyed by table name; tables without progress are absent.
+        """
+        rows = self._query_per_table(lambda binds: f"""
+        SELECT id, table_name, status, NVL(total_rows, 0), NVL(processed_rows, 0),
+               last_processed_key, started_at, updated_at, completed_at, error_message
+        FROM (
+            SELECT p.*,
+                   ROW_NUMBER() OVER (PARTITION BY table_name ORDER BY started_at DESC) rn
+            FROM {self.progress_table} p
+            WHERE table_name IN ({binds})
+        )
+        WHERE rn = 1
+        """, table_names)
+        return {
+            table_name: ValidationProgress(
+                id=id_,
+                table_name=table_name,
+                status=status,
+                total_rows=total_rows,
+                processed_rows=processed_rows,
+                last_processed_key=last_processed_key,
+                started_at=started_at,
+                updated_at=updated_at,
+                completed_at=completed_at,
+                error_message=error_message
+            )
+            for (id_, table_name, status, total_rows, processed_rows, last_processed_key,
+                 started_at, updated_at, completed_at, error_message) in rows
+        }
+    
+    def get_latest_row_counts(self, table_names: List[str]) -> Dict[str, int]:
+        """Get the row count recorded by the latest validation result of each table.
+        
+        Counts may be statistics-based estimates, which is fine for ordering work.
+        Tables that have never been validated are absent from the returned dict.
+        """
+        rows = self._query_per_table(lambda binds: f"""
+        SELECT table_name, NVL(total_rows, 0)
+        FROM (
+            SELECT table_name, total_rows,
+                   ROW_NUMBER() OVER (PARTITION BY table_name ORDER BY completed_at DESC NULLS LAST) rn
+            FROM {self.results_table}
+            WHERE table_name IN ({binds})
+        )
+        WHERE rn = 1
+        """, table_names)
+        return dict(rows)
+    
+    def _query_per_table(self, build_query: Callable[[str], str], table_names: List[str]) -> List[tuple]:
+        """Run a query filtered on an IN-list of table names and return all rows.
+        
+        build_query receives the bind placeholders for the IN-list. Names are
+        de-duplicated and sent in batches of at most MAX_IN_LIST_SIZE, Oracle's
+        limit on IN-list length, so normally this is a single round-trip.
+        """
+        unique_names = list(dict.fromkeys(table_names))
+        rows = []
+        for start in range(0, len(unique_names), MAX_IN_LIST_SIZE):
+            batch = unique_names[start:start + MAX_IN_LIST_SIZE]
+            binds = ", ".join(f":t{i}" for i in range(len(batch)))
+            params = {f"t{i}": table_name for i, table_name in enumerate(batch)}
+            _, batch_rows = self.db_manager.execute_query_rows(build_query(binds), params, arraysize=len(batch))
+            rows.extend(batch_rows)
+        return rows
+    
     def save_result(self, result: ValidationResult) -> int:
-        """Save validation result and return its ID."""
+        """Save validation result and return its ID.
+        
+        Mismatch details attached to the result are saved with it, in the same
+        round-trip when they fit the fused PL/SQL path.
+        """
+        details = result.mismatch_details
+        if details and len(details) <= MAX_FUSED_DETAILS and all(
+            _fits_varchar_bind(detail.key_values)
+            and _fits_varchar_bind(detail.source_value)
+            and _fits_varchar_bind(detail.target_value)
+            for detail in details
+        ):
+            try:
+                return self._save_result_with_details(result)
+            except oracledb.DatabaseError as e:
+                # The block is atomic, so nothing was written; save in separate steps
+                logger.warning(f"Combined result save failed, saving details separately: {e}")
+        
         insert_query = f"""
         INSERT INTO {self.results_table}
         (table_name, total_rows, matched_rows, mismatched_rows, missing_in_target,
          extra_in_target, validation_duration_seconds, started_at, completed_at,
-         status, error_message)
+         status, error_message, validation_signature, total_rows_is_estimate)
         VALUES (:table_name, :total_rows, :matched_rows, :mismatched_rows,
                 :missing_in_target, :extra_in_target, :validation_duration_seconds,
-                :started_at, :completed_at, :status, :error_message)
+                :started_at, :completed_at, :status, :error_message, :validation_signature,
+                :total_rows_is_estimate)
         RETURNING id INTO :id
         """
         
-        with self.db_manager.get_connection() as connection:
+        with self._write_connection() as connection:
+            cursor = self._cached_cursor(connection, insert_query)
+            id_var = cursor.var(int)
+            cursor.execute(insert_query, dict(self._result_params(result), id=id_var))
+            
+            # Get the ID from the returned value
+            validation_id = id_var.getvalue()[0]
+            
+            # Save mismatch details if available
+            if details:
+                self.save_mismatch_details(validation_id, details)
+            
+            connection.commit()
+            return validation_id
+    
+    def _save_result_with_details(self, result: ValidationResult) -> int:
+        """Insert a result and its mismatch details with one PL/SQL call.
+        
+        The detail columns are bound as SYS.ODCIVARCHAR2LIST collections and
+        inserted with FORALL using the result ID captured inside the block.
+        """
+        plsql = f"""
+        DECLARE
+            l_id NUMBER;
+            l_table_names SYS.ODCIVARCHAR2LIST := :detail_table_names;
+            l_mismatch_types SYS.ODCIVARCHAR2LIST := :mismatch_types;
+            l_key_values SYS.ODCIVARCHAR2LIST := :key_values;
+            l_column_names SYS.ODCIVARCHAR2LIST := :column_names;
+            l_source_values SYS.ODCIVARCHAR2LIST := :source_values;
+            l_target_values SYS.ODCIVARCHAR2LIST := :target_values;
+        BEGIN
+            INSERT INTO {self.results_table}
+            (table_name, total_rows, matched_rows, mismatched_rows, missing_in_target,
+             extra_in_target, validation_duration_seconds, started_at, completed_at,
+             status, error_message, validation_signature, total_rows_is_estimate)
+            VALUES (:table_name, :total_rows, :matched_rows, :mismatched_rows,
+                    :missing_in_target, :extra_in_target, :validation_duration_seconds,
+                    :started_at, :completed_at, :status, :error_message, :validation_signature,
+                    :total_rows_is_estimate)
+            RETURNING id INTO l_id;
+            
+            FORALL i IN 1 .. l_key_values.COUNT
+                INSERT INTO {self.mismatch_details_table}
+                (validation_id, table_name, mismatch_type, key_values, column_name,
+                 source_value, target_value)
+                VALUES (l_id, l_table_names(i), l_mismatch_types(i), l_key_values(i),
+                        l_column_names(i), l_source_values(i), l_target_values(i));
+            
+            :id := l_id;
+        END;
+        """
+        
+        details = result.mismatch_details
+        with self._write_connection() as connection:
+            if self._varchar_list_type is None:
+                self._varchar_list_type = connection.gettype("SYS.ODCIVARCHAR2LIST")
+            list_type = self._varchar_list_type
             with self.db_manager.get_cursor(connection) as cursor:
                 id_var = cursor.var(int)
-                cursor.execute(insert_query, {
-                    "table_name": result.table_name,
-                    "total_rows": result.total_rows,
-                    "matched_rows": result.matched_rows,
-                    "mismatched_rows": result.mismatched_rows,
-                    "missing_in_target": result.missing_in_target,
-                    "extra_in_target": result.extra_in_target,
-                    "validation_duration_seconds": result.validation_duration_seconds,
-                    "started_at": result.started_at,
-                    "completed_at": result.completed_at,
-                    "status": result.status,
-                    "error_message": result.error_message,
-                    "id": id_var
-                })
-                
-                # Get the ID from the returned value
-                validation_id = id_var.getvalue()[0]
-                
-                # Save mismatch details if available
-                if result.mismatch_details:
-                    self.save_mismatch_details(validation_id, result.mismatch_details)
-                
-                connection.commit()
-                return validation_id
+                cursor.execute(plsql, dict(
+                    self._result_params(result),
+                    id=id_var,
+                    detail_table_names=list_type.newobject([d.table_name for d in details]),
+                    mismatch_types=list_type.newobject([d.mismatch_type for d in details]),
+                    key_values=list_type.newobject([d.key_values for d in details]),
+                    column_names=list_type.newobject([d.column_name for d in details]),
+                    source_values=list_type.newobject([d.source_value for d in details]),
+                    target_values=list_type.newobject([d.target_value for d in details])
+                ))
+            connection.commit()
+        
+        validation_id = id_var.getvalue()
+        logger.info(f"Saved validation {validation_id} with {len(details)} mismatch details")
+        return validation_id
+    
+    @staticmethod
+    def _result_params(result: ValidationResult) -> dict:
+        return {
+            "table_name": result.table_name,
+            "total_rows": result.total_rows,
+            "total_rows_is_estimate": int(result.total_rows_is_estimate),
+            "matched_rows": result.matched_rows,
+            "mismatched_rows": result.mismatched_rows,
+            "missing_in_target": result.missing_in_target,
+            "extra_in_target": result.extra_in_target,
+            "validation_duration_seconds": result.validation_duration_seconds,
+            "started_at": result.started_at,
+            "completed_at": result.completed_at,
+            "status": result.status,
+            "error_message": result.error_message,
+            "validation_signature": result.validation_signature
+        }
     
     def save_mismatch_details(self, validation_id: int, details: List[MismatchDetail]):
         """Save multiple mismatch details for a validation."""
@@ -230,46 +650,38 @@ class ValidationRepository:
         logger.debug(f"Preparing to save {len(details)} mismatch details for validation {validation_id}")
         
         try:
-            # Create the insert statement with APPEND hint to improve performance
+            # Conventional insert: the foreign key to the results table rules out
+            # direct-path (APPEND) inserts, which Oracle would silently ignore anyway
             insert_query = f"""
-            INSERT /*+ APPEND */ INTO {self.mismatch_details_table}
+            INSERT INTO {self.mismatch_details_table}
             (validation_id, table_name, mismatch_type, key_values, column_name, 
              source_value, target_value)
-            VALUES (:validation_id, :table_name, :mismatch_type, :key_values, 
-                    :column_name, :source_value, :target_value)
+            VALUES (:1, :2, :3, :4, :5, :6, :7)
             """
             
-            # Process in smaller batches to reduce contention
-            BATCH_SIZE = 50
-            total_inserted = 0
+            rows = [
+                (validation_id, detail.table_name, detail.mismatch_type, detail.key_values,
+                 detail.column_name, detail.source_value, detail.target_value)
+                for detail in details
+            ]
             
-            with self.db_manager.get_connection() as connection:
-                # Set a longer timeout for the connection
-                connection.callTimeout = 120000  # 2 minutes
-                
-                for i in range(0, len(details), BATCH_SIZE):
-                    batch = details[i:i+BATCH_SIZE]
-                    params_list = []
-                    
-                    for detail in batch:
-                        params_list.append({
-                            "validation_id": validation_id,
-                            "table_name": detail.table_name,
-                            "mismatch_type": detail.mismatch_type,
-                            "key_values": detail.key_values,
-                            "column_name": detail.column_name,
-                            "source_value": detail.source_value,
-                            "target_value": detail.target_value
-                        })
-                    
-                    # Execute the batch
-                    with self.db_manager.get_cursor(connection) as cursor:
-                        cursor.executemany(insert_query, params_list)
-                        connection.commit()
-                        total_inserted += len(batch)
-                        logger.debug(f"Saved batch of {len(batch)} mismatch details ({total_inserted}/{len(details)} total)")
-                
-            logger.info(f"Successfully saved all {total_inserted} mismatch details for validation {validation_id}")
+            # Array-bind in large batches with a single commit; failing rows are
+            # reported instead of aborting the whole batch
+            with self._write_connection() as connection:
+                errors = self.db_manager.execute_many(
+                    insert_query,
+                    rows,
+                    batcherrors=True,
+                    call_timeout=120000,  # 2 minutes
+                    input_sizes=_mismatch_detail_input_sizes(rows),
+                    batch_size=MISMATCH_DETAIL_BATCH_SIZE,
+                    connection=connection
+                )
+            for offset, error in errors:
+                logger.warning(f"Failed to save mismatch detail at offset {offset}: {error.message}")
+            
+            logger.info(f"Successfully saved {len(details) - len(errors)} of {len(details)} mismatch details "
+                        f"for validation {validation_id}")
             
         except Exception as e:
             logger.error(f"Error saving mismatch details: {e}")
@@ -280,50 +692,86 @@ class ValidationRepository:
     def get_mismatch_details(self, validation_id: int) -> List[MismatchDetail]:
         """Get mismatch details for a specific validation."""
         query = f"""
-        SELECT * FROM {self.mismatch_details_table}
+        SELECT id, validation_id, table_name, mismatch_type, key_values, column_name,
+               source_value, target_value, capture_time
+        FROM {self.mismatch_details_table}
         WHERE validation_id = :validation_id
         ORDER BY id
         """
         
-        result = self.db_manager.execute_query(query, {"validation_id": validation_id})
+        # Rows come back as tuples in select-list order, unpacked positionally
+        _, rows = self.db_manager.execute_query_rows(query, {"validation_id": validation_id}, arraysize=5000)
         return [
             MismatchDetail(
-                id=row['ID'],
-                validation_id=row['VALIDATION_ID'],
-                table_name=row['TABLE_NAME'],
-                mismatch_type=row['MISMATCH_TYPE'],
-                key_values=row['KEY_VALUES'],
-                column_name=row['COLUMN_NAME'],
-                source_value=row['SOURCE_VALUE'],
-                target_value=row['TARGET_VALUE'],
-                capture_time=row['CAPTURE_TIME']
+                id=id_,
+                validation_id=validation_id_,
+                table_name=table_name,
+                mismatch_type=mismatch_type,
+                key_values=key_values,
+                column_name=column_name,
+                source_value=source_value,
+                target_value=target_value,
+                capture_time=capture_time
             )
-            for row in result
+            for (id_, validation_id_, table_name, mismatch_type, key_values, column_name,
+                 source_value, target_value, capture_time) in rows
         ]
     
     def get_recent_results(self, limit: int = 10) -> List[ValidationResult]:
         """Get recent validation results."""
         query = f"""
-        SELECT * FROM {self.results_table}
+        SELECT {RESULT_COLUMNS}
+        FROM {self.results_table}
         ORDER BY completed_at DESC
         FETCH FIRST :limit ROWS ONLY
         """
         
-        results = self.db_manager.execute_query(query, {"limit": limit})
-        return [
-            ValidationResult(
-                id=row['ID'],
-                table_name=row['TABLE_NAME'],
-                total_rows=row['TOTAL_ROWS'] or 0,
-                matched_rows=row['MATCHED_ROWS'] or 0,
-                mismatched_rows=row['MISMATCHED_ROWS'] or 0,
-                missing_in_target=row['MISSING_IN_TARGET'] or 0,
-                extra_in_target=row['EXTRA_IN_TARGET'] or 0,
-                validation_duration_seconds=row['VALIDATION_DURATION_SECONDS'] or 0,
-                started_at=row['STARTED_AT'],
-                completed_at=row['COMPLETED_AT'],
-                status=row['STATUS'],
-                error_message=row['ERROR_MESSAGE']
-            )
-            for row in results
-        ]
\ No newline at end of file
+        _, rows = self.db_manager.execute_query_rows(query, {"limit": limit}, arraysize=limit)
+        return [self._result_from_row(row) for row in rows]
+    
+    def get_cached_result(self, table_name: str, signature: str,
+                          max_age_seconds: float) -> Optional[ValidationResult]:
+        """Get the latest successful result saved with signature within max_age_seconds, if any.
+        
+        completed_at is bound by the validator from the client clock, so the cutoff is too.
+        """
+        query = f"""
+        SELECT {RESULT_COLUMNS}
+        FROM {self.results_table}
+        WHERE table_name = :table_name
+        AND status = 'SUCCESS'
+        AND validation_signature = :signature
+        AND completed_at >= :not_before
+        ORDER BY completed_at DESC
+        FETCH FIRST 1 ROWS ONLY
+        """
+        
+        _, rows = self.db_manager.execute_query_rows(query, {
+            "table_name": table_name,
+            "signature": signature,
+            "not_before": datetime.now() - timedelta(seconds=max_age_seconds)
+        }, arraysize=1)
+        return self._result_from_row(rows[0]) if rows else None
+    
+    @staticmethod
+    def _result_from_row(row: tuple) -> ValidationResult:
+        """Build a ValidationResult from a row selected as RESULT_COLUMNS."""
+        (id_, table_name, total_rows, matched_rows, mismatched_rows, missing_in_target,
+         extra_in_target, validation_duration_seconds, started_at, completed_at,
+         status, error_message, validation_signature, total_rows_is_estimate) = row
+        return ValidationResult(
+            id=id_,
+            table_name=table_name,
+            total_rows=total_rows,
+            total_rows_is_estimate=bool(total_rows_is_estimate),
+            matched_rows=matched_rows,
+            mismatched_rows=mismatched_rows,
+            missing_in_target=missing_in_target,
+            extra_in_target=extra_in_target,
+            validation_duration_seconds=validation_duration_seconds,
+            started_at=started_at,
+            completed_at=completed_at,
+            status=status,
+            error_message=error_message,
+            validation_signature=validation_signature
+        )
@@ -1,25 +1,46 @@
 import asyncio
 import logging
-import multiprocessing
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime
-from typing import List
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 
-from .config import ValidationConfig, ValidationResult
+from .config import TableMapping, ValidationConfig, ValidationResult
 from .db.connection import OracleConnectionManager
 from .db.repository import ValidationRepository
 from .validators.table_validator import TableValidator
+from .utils.result_cache import ResultCache
 from .utils.window_checker import WindowChecker
 
 logger = logging.getLogger(__name__)
 
+# Consecutive table failures after which no further tables are started
+MAX_CONSECUTIVE_FAILURES = 5
+
+# Finished tables between INFO progress summaries
+PROGRESS_LOG_INTERVAL = 50
+
+
+class ValidationAborted(Exception):
+    """Raised when a run stops early; results holds the tables that completed."""
+    def __init__(self, message: str, results: List[ValidationResult]):
+        super().__init__(message)
+        self.results = results
+
 
 class ValidationOrchestrator:
     def __init__(self, config: ValidationConfig):
         self.config = config
         
-        # Initialize target database connection
-        self.target_db = OracleConnectionManager(config.target_db)
+        # Initialize target database connection; the pool needs room for every
+        # concurrent validation plus the repository's write connection
+        self.target_db = OracleConnectionManager(
+            config.target_db,
+            pool_min=config.target_db.pool_min,
+            pool_max=max(config.target_db.pool_max, config.max_concurrent_validations * 2),
+            pool_increment=config.target_db.pool_increment,
+            arraysize=config.fetch_array_size,
+            prefetchrows=config.fetch_array_size
+        )
         
         # Initialize repository (using target_db for storing results)
         self.repository = ValidationRepository(
@@ -31,6 +52,15 @@ class ValidationOrchestrator:
         
         # Initialize utilities
         self.window_checker = WindowChecker(config.run_window)
+        self.result_cache = (
+            ResultCache(config.result_cache_ttl_seconds, config.result_cache_max_entries)
+            if config.result_cache_ttl_seconds else None
+        )
+        
+        # Monotonic time of the last successful initialize(); repository tables
+        # only need creating once per orchestrator
+        self._last_init_ok = float('-inf')
+        self._tables_initialized = False
         
         # Initialize validator
         self.table_validator = TableValidator(
@@ -41,7 +71,15 @@ class ValidationOrchestrator:
         )
     
     def initialize(self):
-        """Initialize the validation system."""
+        """Initialize the validation system.
+        
+        The connection probes are skipped if they succeeded within the last
+        init_probe_ttl_seconds, and the repository tables are only checked once.
+        """
+        if time.monotonic() - self._last_init_ok < self.config.init_probe_ttl_seconds:
+            logger.debug("Validation system initialized recently, skipping connection checks")
+            return
+        
         logger.info("Initializing validation system...")
         
         # Test target database connection
@@ -49,20 +87,28 @@ class ValidationOrchestrator:
             raise Exception("Failed to connect to target database")
         
         # Test source database through the database link
-        try:
-            test_query = f"SELECT 1 FROM DUAL@{self.config.db_link_name}"
-            self.target_db.execute_query(test_query)
-            logger.info(f"Successfully connected to source database through DB link '{self.config.db_link_name}'")
-        except Exception as e:
-            raise Exception(f"Failed to connect to source database through DB link: {e}")
+        if not self.target_db.test_connection(f"SELECT 1 FROM DUAL@{self.config.db_link_name}"):
+            raise Exception(f"Failed to connect to source database through DB link '{self.config.db_link_name}'")
+        logger.info(f"Successfully connected to source database through DB link '{self.config.db_link_name}'")
         
         # Initialize repository tables
-        self.repository.initialize_tables()
+        if not self._tables_initialized:
+            self.repository.initialize_tables()
+            self._tables_initialized = True
         
+        self._last_init_ok = time.monotonic()
         logger.info("Validation system initialized successfully")
     
     def run_validation(self) -> List[ValidationResult]:
         """Run the complete validation process."""
+        return asyncio.run(self.run_validation_async())
+    
+    async def run_validation_async(self) -> List[ValidationResult]:
+        """Run the complete validation process on the running event loop."""
+        return await self._run_async(self.config.table_mappings)
+    
+    async def _run_async(self, mappings: List[TableMapping]) -> List[ValidationResult]:
+        """Run the validation process for the given mappings."""
         logger.info("Starting validation process...")
         
         # Check if we're within the run window
@@ -74,66 +120,224 @@ class ValidationOrchestrator:
         # Initialize if needed
         self.initialize()
         
-        # Run validations
-        results = self._run_concurrent_validations()
+        # Column metadata is cached for one run so schema changes are seen by the next;
+        # reading it for every table up front saves a round-trip per table
+        self.table_validator.clear_metadata_cache()
+        try:
+            self.table_validator.preload_column_metadata([mapping.source_table for mapping in mappings])
+        except Exception as e:
+            logger.warning(f"Could not preload column metadata, reading it per table: {e}")
         
+        # Run validations
+        results = await self.run_parallel_async(mappings)
         
         logger.info(f"Validation process completed. Processed {len(results)} tables")
         return results
     
-    def _run_concurrent_validations(self) -> List[ValidationResult]:
-        """Run table validations concurrently."""
+    def run_forever_scheduled(self, interval_seconds: float = 0):
+        """Run validations every time the run window opens, until interrupted."""
+        asyncio.run(self.run_forever_scheduled_async(interval_seconds))
+    
+    async def run_forever_scheduled_async(self, interval_seconds: float = 0):
+        """Run validations each time the run window opens.
+        
+        Sleeps until the window opens rather than polling, then runs a full
+        validation. interval_seconds is waited between runs; with no interval
+        the next run waits for the window's next opening, so each window gets
+        one run. Without a run window a positive interval is required. A failed
+        run is logged and does not stop the schedule.
+        """
+        if interval_seconds <= 0 and self.config.run_window is None:
+            raise ValueError("Scheduling without a run window needs a positive interval")
+        
+        while True:
+            delay = self.window_checker.seconds_until_window_opens()
+            if delay is None:
+                logger.warning("Run window has no allowed days, not scheduling validations")
+                return
+            if delay:
+                logger.info("Next run window opens in %d seconds", delay)
+                await asyncio.sleep(delay)
+            
+            try:
+                await self.run_validation_async()
+            except Exception:
+                logger.exception("Scheduled validation run failed, continuing with the next run")
+            
+            if interval_seconds > 0:
+                await asyncio.sleep(interval_seconds)
+            else:
+                # One run per window: wait for the next opening rather than restarting
+                delay = self.window_checker.seconds_until_next_window()
+                if delay is None:
+                    return
+                logger.info("Next run window opens in %d seconds", delay)
+                await asyncio.sleep(delay)
+    
+    def run_parallel(self, mappings: List[TableMapping]) -> List[ValidationResult]:
+        """Validate the given table mappings concurrently."""
+        return asyncio.run(self.run_parallel_async(mappings))
+    
+    async def run_parallel_async(self, mappings: List[TableMapping]) -> List[ValidationResult]:
+        """Validate the given table mappings concurrently from the event loop.
+        
+        At most max_concurrent_validations tables are in flight, each running its
+        blocking database work on an executor thread; the next table starts as
+        soon as one finishes. The bound is capped at the connection pool size so
+        validations never wait for a pooled connection. After
+        MAX_CONSECUTIVE_FAILURES failures in a row no further tables are started;
+        the running ones are finished and ValidationAborted is raised with every
+        completed result. Progress entries of tables not started stay resumable.
+        """
+        max_concurrent = min(self.config.max_concurrent_validations, self.target_db.pool_max)
+        
+        # Start the largest tables first so a big table is not left running alone at the end
+        mappings = self._order_by_estimated_size(mappings)
+        
+        # Create all progress entries up front in a single round-trip
+        progress_ids = self.repository.create_progress_entries([mapping.source_table for mapping in mappings])
+        
+        loop = asyncio.get_running_loop()
+        queued = iter(zip(mappings, progress_ids))
+        in_flight = {}
         results = []
+        consecutive_failures = 0
+        completed = 0
+        total = len(mappings)
+        
+        def collect(future, mapping):
+            nonlocal consecutive_failures
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.error(f"Error validating {mapping.source_table}: {e}")
+                consecutive_failures += 1
+            else:
+                consecutive_failures = 0
+                if result:  # None if outside window
+                    results.append(result)
+                    logger.debug("Completed validation for %s", mapping.source_table)
         
-        with ThreadPoolExecutor(max_workers=self.config.max_concurrent_validations) as executor:
-            # Submit all validation tasks
-            future_to_mapping = {
-                executor.submit(self._validate_table_with_window_check, mapping): mapping
-                for mapping in self.config.table_mappings
-            }
+        with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
+            def start_next():
+                item = next(queued, None)
+                if item is not None:
+                    mapping, progress_id = item
+                    future = loop.run_in_executor(
+                        executor, self._validate_table_with_window_check, mapping, progress_id
+                    )
+                    in_flight[future] = mapping
+            
+            for _ in range(max_concurrent):
+                start_next()
             
-            # Process completed validations
-            for future in as_completed(future_to_mapping):
-                mapping = future_to_mapping[future]
+            while in_flight:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    collect(future, in_flight.pop(future))
+                    completed += 1
                 
-                try:
-                    result = future.result()
-                    if result:  # None if outside window
-                        results.append(result)
-                        logger.info(f"Completed validation for {mapping.source_table}")
-                except Exception as e:
-                    logger.error(f"Error validating {mapping.source_table}: {e}")
+                if completed % PROGRESS_LOG_INTERVAL < len(done) or completed == total:
+                    logger.info("Progress: %d/%d tables completed", completed, total)
+                
+                if consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
+                    # Let the validations already running finish, but start no more
+                    failures = consecutive_failures
+                    if in_flight:
+                        await asyncio.wait(in_flight)
+                        for future in list(in_flight):
+                            collect(future, in_flight.pop(future))
+                    self.repository.flush_progress()
+                    raise ValidationAborted(
+                        f"Stopping after {failures} consecutive validation failures", results
+                    )
+                
+                for _ in done:
+                    start_next()
         
+        self.repository.flush_progress()
         return results
     
-    def _validate_table_with_window_check(self, mapping) -> ValidationResult:
+    def _order_by_estimated_size(self, mappings: List[TableMapping]) -> List[TableMapping]:
+        """Order mappings largest first, using row counts from each table's last validation.
+        
+        Tables without a previous result are treated as empty and go last. The
+        ordering is only an optimisation, so lookup failures leave it unchanged.
+        """
+        try:
+            row_counts = self.repository.get_latest_row_counts([mapping.source_table for mapping in mappings])
+        except Exception as e:
+            logger.warning(f"Could not estimate table sizes, keeping configured order: {e}")
+            return list(mappings)
+        
+        return sorted(mappings, key=lambda mapping: row_counts.get(mapping.source_table, 0), reverse=True)
+    
+    def _validate_table_with_window_check(self, mapping, progress_id: int) -> ValidationResult:
         """Validate a table with window check."""
         # Check if we're still within the run window
         if not self.window_checker.is_within_window():
-            logger.info(f"Skipping {mapping.source_table} - outside run window")
+            logger.info("Skipping %s - outside run window", mapping.source_table)
+            # Leave the pre-created progress entry resumable
+            self.repository.update_progress(progress_id, 0, status="PAUSED")
             return None
         
-        return self.table_validator.validate_table(mapping)
+        # The validation holds one pooled connection for its whole run
+        with self.target_db.get_connection() as connection:
+            signature = None
+            if self.result_cache is not None:
+                # The cache is only an optimisation, so a failed lookup just validates the table
+                try:
+                    signature = self.table_validator.get_table_signature(mapping, connection)
+                except Exception as e:
+                    logger.warning(f"Could not read table signature for {mapping.source_table}, validating without the cache: {e}")
+                    signature = None
+                cached = self._get_cached_result(mapping, signature) if signature else None
+                if cached is not None:
+                    logger.info("Skipping %s - unchanged since validation at %s", mapping.source_table, cached.completed_at)
+                    self.repository.complete_progress(progress_id, status="SKIPPED")
+                    return cached.model_copy(update={"status": "SKIPPED_CACHED"})
+            
+            result = self.table_validator.validate_table(mapping, progress_id, connection, signature)
+        
+        if signature and result.status == "SUCCESS":
+            self.result_cache.put(mapping.source_table, signature, result)
+        return result
+    
+    def _get_cached_result(self, mapping: TableMapping, signature: str) -> Optional[ValidationResult]:
+        """Find a reusable result for an unchanged table.
+        
+        Results validated by this process are kept in memory; otherwise the
+        results table is searched, so the cache also covers separate runs.
+        """
+        cached = self.result_cache.get(mapping.source_table, signature)
+        if cached is None:
+            try:
+                cached = self.repository.get_cached_result(
+                    mapping.source_table, signature, self.config.result_cache_ttl_seconds
+                )
+            except Exception as e:
+                logger.warning(f"Could not look up a cached result for {mapping.source_table}: {e}")
+        return cached
     
     def resume_validations(self) -> List[ValidationResult]:
         """Resume any paused or failed validations."""
         logger.info("Checking for validations to resume...")
         
         # Find tables with incomplete validations
-        resumable_tables = []
-        for mapping in self.config.table_mappings:
-            progress = self.repository.get_latest_progress(mapping.source_table)
-            
-            if progress and progress.status in ['IN_PROGRESS', 'PAUSED', 'FAILED']:
-                logger.info(f"Found resumable validation for {mapping.source_table}")
-                resumable_tables.append(mapping)
+        latest_progress = self.repository.get_latest_progress_bulk(
+            [mapping.source_table for mapping in self.config.table_mappings]
+        )
+        resumable_tables = [
+            mapping for mapping in self.config.table_mappings
+            if mapping.source_table in latest_progress
+            and latest_progress[mapping.source_table].status in ('IN_PROGRESS', 'PAUSED', 'FAILED')
+        ]
+        for mapping in resumable_tables:
+            logger.info(f"Found resumable validation for {mapping.source_table}")
         
         if not resumable_tables:
             logger.info("No validations to resume")
             return []
         
-        # Update config to only validate resumable tables
-        self.config.table_mappings = resumable_tables
-        
-        # Run validation
-        return self.run_validation()
\ No newline at end of file
+        # Run validation for the resumable tables only, leaving the config untouched
+        return asyncio.run(self._run_async(resumable_tables))
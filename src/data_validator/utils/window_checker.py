@@ -1,5 +1,6 @@
 import logging
-from datetime import datetime, time
+import time as time_module
+from datetime import datetime, time, timedelta
 from typing import Optional
 
 from ..config import RunWindow
@@ -7,71 +8,110 @@ from ..config import RunWindow
 logger = logging.getLogger(__name__)
 
 
+def _seconds_of_day(value: time) -> int:
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
 class WindowChecker:
+    __slots__ = ("run_window", "_cached", "_start_seconds", "_end_seconds", "_crosses_midnight", "_days_mask")
+    
+    def __new__(cls, run_window: Optional[RunWindow] = None):
+        # Without a window every check has a constant answer
+        if run_window is None and cls is WindowChecker:
+            cls = _OpenWindowChecker
+        return super().__new__(cls)
+    
     def __init__(self, run_window: Optional[RunWindow]):
         self.run_window = run_window
+        # The answer for "now" only changes between seconds, so it is computed
+        # once per wall-clock second and kept as (second, result). Replacing the
+        # tuple is atomic; concurrent callers at most recompute the same second
+        self._cached = (-1, False)
+        
+        if run_window:
+            # Window bounds as seconds since midnight, compared as plain ints
+            self._start_seconds = _seconds_of_day(run_window.start_time)
+            self._end_seconds = _seconds_of_day(run_window.end_time)
+            self._crosses_midnight = self._end_seconds < self._start_seconds
+            self._days_mask = run_window.days_mask
     
     def is_within_window(self, check_time: Optional[datetime] = None) -> bool:
         """Check if current time is within the configured run window."""
-        if not self.run_window:
-            return True  # No window configured, always allowed
-        
-        check_time = check_time or datetime.now()
-        current_time = check_time.time()
+        if check_time is None:
+            second = int(time_module.time())
+            cached_second, cached_result = self._cached
+            if cached_second == second:
+                return cached_result
+            result = self._check_time(datetime.fromtimestamp(second))
+            self._cached = (second, result)
+            return result
+        return self._check_time(check_time)
+    
+    def _check_time(self, check_time: datetime) -> bool:
         current_day = check_time.weekday()  # 0=Monday, 6=Sunday
         
         # Check if current day is allowed
-        if current_day not in self.run_window.days_of_week:
-            logger.info(f"Current day {current_day} not in allowed days {self.run_window.days_of_week}")
+        if not (self._days_mask >> current_day) & 1:
+            logger.info("Current day %s not in allowed days %s", current_day, self.run_window.days_of_week)
             return False
         
         # Check if current time is within window
-        if self.run_window.start_time <= self.run_window.end_time:
+        current_seconds = check_time.hour * 3600 + check_time.minute * 60 + check_time.second
+        if not self._crosses_midnight:
             # Normal case: window doesn't cross midnight
-            in_window = self.run_window.start_time <= current_time <= self.run_window.end_time
+            in_window = self._start_seconds <= current_seconds <= self._end_seconds
         else:
             # Window crosses midnight
-            in_window = current_time >= self.run_window.start_time or current_time <= self.run_window.end_time
+            in_window = current_seconds >= self._start_seconds or current_seconds <= self._end_seconds
         
         if not in_window:
-            logger.info(f"Current time {current_time} not within window {self.run_window.start_time}-{self.run_window.end_time}")
+            logger.info("Current time %s not within window %s-%s",
+                        check_time.time(), self.run_window.start_time, self.run_window.end_time)
             
         return in_window
     
-    def seconds_until_window_opens(self) -> Optional[int]:
+    def seconds_until_window_opens(self, now: Optional[datetime] = None) -> Optional[int]:
         """Calculate seconds until the next window opens."""
-        if not self.run_window:
-            return 0  # No window, always open
-        
-        now = datetime.now()
-        current_time = now.time()
-        current_day = now.weekday()
-        
         # If we're already in the window, return 0
         if self.is_within_window(now):
             return 0
+        return self.seconds_until_next_window(now)
+    
+    def seconds_until_next_window(self, now: Optional[datetime] = None) -> Optional[int]:
+        """Calculate seconds until the next window start, even if a window is open now."""
+        now = now or datetime.now()
+        current_day = now.weekday()
         
-        # Find the next allowed day
-        days_to_check = 7  # Maximum days to check
-        for days_ahead in range(days_to_check):
-            check_day = (current_day + days_ahead) % 7
-            
-            if check_day in self.run_window.days_of_week:
-                # Calculate the target datetime
-                target_date = now.date()
-                if days_ahead > 0:
-                    from datetime import timedelta
-                    target_date = target_date + timedelta(days=days_ahead)
-                
-                target_datetime = datetime.combine(target_date, self.run_window.start_time)
-                
-                # If it's today and the start time has passed, try tomorrow
-                if days_ahead == 0 and current_time > self.run_window.start_time:
-                    continue
-                
-                # Calculate seconds until target
-                seconds_until = (target_datetime - now).total_seconds()
-                return max(0, int(seconds_until))
+        # Rotate the allowed-days mask so bit 0 is today and bit n is n days ahead
+        rotated = ((self._days_mask >> current_day) | (self._days_mask << (7 - current_day))) & 0x7F
+        if rotated == 0:
+            return None  # No allowed days
+        
+        # Today's window start has already passed; the next one is a week away at most
+        if now.hour * 3600 + now.minute * 60 + now.second >= self._start_seconds:
+            rotated = (rotated & ~1) | (rotated & 1) << 7
+        
+        # The lowest set bit is the next allowed day
+        days_ahead = (rotated & -rotated).bit_length() - 1
+        target_datetime = datetime.combine(now.date() + timedelta(days=days_ahead), self.run_window.start_time)
         
-        # Shouldn't reach here if days_of_week is not empty
-        return None
\ No newline at end of file
+        # Calculate seconds until target
+        seconds_until = (target_datetime - now).total_seconds()
+        return max(0, int(seconds_until))
+
+
+class _OpenWindowChecker(WindowChecker):
+    """WindowChecker used when no run window is configured: always open."""
+    __slots__ = ()
+    
+    @staticmethod
+    def is_within_window(check_time: Optional[datetime] = None) -> bool:
+        return True
+    
+    @staticmethod
+    def seconds_until_window_opens(now: Optional[datetime] = None) -> Optional[int]:
+        return 0
+    
+    @staticmethod
+    def seconds_until_next_window(now: Optional[datetime] = None) -> Optional[int]:
+        return 0
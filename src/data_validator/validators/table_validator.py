@@ -1,15 +1,48 @@
+import hashlib
 import logging
+import threading
 import time
 import json
+from contextlib import nullcontext
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Union
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+import oracledb
 
 from ..config import TableMapping, ValidationResult, MismatchDetail
 from ..db.connection import OracleConnectionManager
-from ..db.repository import ValidationRepository
+from ..db.repository import MAX_IN_LIST_SIZE, ValidationRepository
 
 logger = logging.getLogger(__name__)
 
+# Column types that cannot be concatenated into a row hash and are compared individually
+LOB_TYPES = ('CLOB', 'NCLOB', 'BLOB')
+
+# Declared size of string pagination binds; a fixed size keeps Oracle from creating
+# new child cursors as key lengths vary between chunks
+KEY_BIND_SIZE = 4000
+
+# Numeric column types whose pagination keys are bound as numbers
+NUMERIC_TYPES = ('NUMBER', 'FLOAT', 'BINARY_FLOAT', 'BINARY_DOUBLE')
+
+# Separates column values in a row hash, so ('a', 'bc') and ('ab', 'c') hash differently
+ROW_HASH_SEPARATOR = "CHR(31)"
+
+# Longest VARCHAR2 expression, in bytes, a row hash input may build (the limit
+# without MAX_STRING_SIZE=EXTENDED); wider rows are hashed in column groups
+MAX_HASH_INPUT_BYTES = 4000
+
+# Optimizer statistics older than this are not used as a table's row count
+ROW_COUNT_STATS_MAX_AGE_DAYS = 7
+
+# ORA-00955 (name already used) and ORA-14452 (index on a temporary table in use):
+# another validation created the snapshot table or its index first
+SNAPSHOT_DDL_RACE_ERRORS = (955, 14452)
+
+# Extra-in-target anti-join: hash join at the target, pulling the source keys across the link once
+EXTRA_IN_TARGET_HINT = "/*+ USE_HASH(t s) DRIVING_SITE(t) */"
+
 
 class TableValidator:
     def __init__(self, target_db: OracleConnectionManager, db_link_name: str, repository: ValidationRepository, config=None):
@@ -18,21 +51,102 @@ class TableValidator:
         self.repository = repository
         self.config = config  # Store the config for access to mismatch details settings
         # The DB link is created on the target database pointing to the source
+        # Connection of the validation running on the current thread
+        self._local = threading.local()
+        # Source column names (in column order) and data types per table, read once
+        self._column_metadata: Dict[str, Tuple[List[str], Dict[str, str]]] = {}
+        # Source column declared lengths in bytes per table, read with the metadata
+        self._column_lengths: Dict[str, Dict[str, int]] = {}
+        # Target index whose leading columns are a table's natural keys, per (table, keys)
+        self._key_indexes: Dict[Tuple[str, Tuple[str, ...]], Optional[str]] = {}
+        # Last successful validation time per table, read once per validation
+        self._last_run_times: Dict[str, Optional[datetime]] = {}
     
-    def validate_table(self, mapping: TableMapping) -> ValidationResult:
-        """Validate a single table mapping."""
+    def clear_metadata_cache(self):
+        """Forget cached column and index metadata so the next validation re-reads it."""
+        self._column_metadata.clear()
+        self._column_lengths.clear()
+        self._key_indexes.clear()
+    
+    def preload_column_metadata(self, table_names: List[str]):
+        """Read the source column metadata of many tables into the cache at once.
+        
+        One dictionary query over the link covers up to MAX_IN_LIST_SIZE tables.
+        Tables not found keep no cache entry and are looked up individually later.
+        """
+        # Configured names may differ in case from the dictionary's
+        names_by_upper: Dict[str, List[str]] = {}
+        for table_name in dict.fromkeys(table_names):
+            names_by_upper.setdefault(table_name.upper(), []).append(table_name)
+        
+        upper_names = list(names_by_upper)
+        metadata: Dict[str, Tuple[List[str], Dict[str, str]]] = {}
+        lengths: Dict[str, Dict[str, int]] = {}
+        for start in range(0, len(upper_names), MAX_IN_LIST_SIZE):
+            batch = upper_names[start:start + MAX_IN_LIST_SIZE]
+            query = f"""
+            SELECT table_name, column_name, data_type, data_length
+            FROM user_tab_columns@{self.db_link_name}
+            WHERE table_name IN ({", ".join(f":t{i}" for i in range(len(batch)))})
+            ORDER BY table_name, column_id
+            """
+            params = {f"t{i}": table_name for i, table_name in enumerate(batch)}
+            _, rows = self.target_db.execute_query_rows(query, params, connection=self._connection)
+            for table_name, column_name, data_type, data_length in rows:
+                columns, column_info = metadata.setdefault(table_name, ([], {}))
+                columns.append(column_name)
+                column_info[column_name] = data_type
+                lengths.setdefault(table_name, {})[column_name] = data_length
+        
+        for upper_name, table_metadata in metadata.items():
+            for table_name in names_by_upper[upper_name]:
+                self._column_metadata[table_name] = table_metadata
+                self._column_lengths[table_name] = lengths[upper_name]
+    
+    @property
+    def _connection(self):
+        return getattr(self._local, 'connection', None)
+    
+    def _execute_query(self, query: str, params: Optional[Dict] = None, **kwargs):
+        """Run a query on the current validation's connection."""
+        return self.target_db.execute_query(query, params, connection=self._connection, **kwargs)
+    
+    def validate_table(self, mapping: TableMapping, progress_id: Optional[int] = None,
+                       connection=None, signature: Optional[str] = None) -> ValidationResult:
+        """Validate a single table mapping.
+        
+        progress_id is an existing progress entry to report to; one is created if
+        it is not given. All validation queries for the table run on connection,
+        or on one connection acquired from the pool for the whole validation.
+        signature, from get_table_signature, is saved with the result.
+        """
+        with self.target_db.connection_scope(connection) as connection:
+            previous_connection = self._connection
+            self._local.connection = connection
+            try:
+                return self._validate_table(mapping, progress_id, signature)
+            finally:
+                self._local.connection = previous_connection
+    
+    def _validate_table(self, mapping: TableMapping, progress_id: Optional[int],
+                        signature: Optional[str] = None) -> ValidationResult:
+        """Validate a table on the connection set up by validate_table."""
         logger.info(f"Starting validation for table {mapping.source_table}")
         if mapping.incremental_mode:
             logger.info(f"Using incremental validation mode with column: {mapping.incremental_column}")
         
         start_time = datetime.now()
         
+        # The last run time is read once per validation and reused for every chunk
+        self._last_run_times.pop(mapping.source_table, None)
+        
         # Create progress entry
-        progress_id = self.repository.create_progress_entry(mapping.source_table)
+        if progress_id is None:
+            progress_id = self.repository.create_progress_entry(mapping.source_table)
         
         try:
             # Get total row count - still using source_db since we want to count source rows
-            total_rows = self._get_table_row_count(
+            total_rows, total_rows_is_estimate = self._get_table_row_count(
                 mapping.source_table, 
                 mapping.where_clause,
                 mapping.incremental_mode,
@@ -41,7 +155,7 @@ class TableValidator:
             self.repository.update_progress(progress_id, 0, status="IN_PROGRESS")
             
             # Perform validation in chunks
-            result = self._validate_in_chunks(mapping, progress_id, total_rows)
+            result = self._validate_in_chunks(mapping, progress_id, total_rows, total_rows_is_estimate)
             
             # Complete progress
             self.repository.complete_progress(progress_id, status="COMPLETED")
@@ -53,23 +167,23 @@ class TableValidator:
             # Process any mismatch details
             mismatch_details = []
             if 'mismatch_details' in result and self.config and self.config.store_mismatch_details:
-                # Convert raw mismatch details to MismatchDetail objects
-                for detail in result['mismatch_details']:
-                    mismatch_details.append(MismatchDetail(
+                # Convert raw mismatch details to MismatchDetail objects; the values come
+                # straight from our own queries, so pydantic validation is skipped
+                mismatch_details = [
+                    MismatchDetail.model_construct(
                         validation_id=0,  # Will be set when saving
                         table_name=mapping.source_table,
-                        mismatch_type=detail['mismatch_type'],
-                        key_values=detail['key_values'],
-                        column_name=detail['column_name'],
-                        source_value=detail['source_value'],
-                        target_value=detail['target_value']
-                    ))
+                        **detail
+                    )
+                    for detail in result['mismatch_details']
+                ]
             
-            # First save the validation result to get an ID
+            # Save the result together with its mismatch details
             validation_result = ValidationResult(
                 id=0,  # Will be set by repository
                 table_name=mapping.source_table,
                 total_rows=total_rows,
+                total_rows_is_estimate=total_rows_is_estimate,
                 matched_rows=result['matched'],
                 mismatched_rows=result['mismatched'],
                 missing_in_target=result['missing_in_target'],
@@ -79,21 +193,16 @@ class TableValidator:
                 completed_at=end_time,
                 status="SUCCESS" if result['mismatched'] == 0 else "PARTIAL",
                 error_message=None,
-                mismatch_details=[]  # Don't pass mismatch_details here, we'll handle them separately
+                validation_signature=signature,
+                mismatch_details=mismatch_details
             )
             
             # Save the result and get the assigned ID
             validation_id = self.repository.save_result(validation_result)
             validation_result.id = validation_id
             
-            # Now save the mismatch details with the correct validation_id
-            if mismatch_details and hasattr(self, 'config') and self.config.store_mismatch_details:
-                logger.info(f"Saving {len(mismatch_details)} mismatch details for validation {validation_id}")
-                # Update each mismatch detail with the correct validation_id
-                for detail in mismatch_details:
-                    detail.validation_id = validation_id
-                # Save the details
-                self.repository.save_mismatch_details(validation_id, mismatch_details)
+            for detail in mismatch_details:
+                detail.validation_id = validation_id
             
             return validation_result
             
@@ -122,28 +231,274 @@ class TableValidator:
             self.repository.save_result(validation_result)
             raise
     
+    def get_table_signature(self, mapping: TableMapping, connection=None) -> Optional[str]:
+        """Return a cheap change signature for a table, or None if it cannot have one.
+        
+        The signature hashes, for both the source and the target, MAX(incremental_column)
+        (an index min/max lookup when the column is indexed), the table's last DDL
+        time, which a TRUNCATE also moves, and its DML counts since statistics were
+        last gathered. No rows are counted. Tables without an incremental column have
+        no reliable change marker and get None.
+        """
+        if not mapping.incremental_column:
+            return None
+        
+        column = mapping.incremental_column
+        params = {}
+        markers = []
+        for side, table_name, link in (("source", mapping.source_table, f"@{self.db_link_name}"),
+                                       ("target", mapping.target_table, "")):
+            objects = self._dictionary_view("objects", "owner", "object_name", table_name, link, side, params)
+            modifications = self._dictionary_view(
+                "tab_modifications", "table_owner", "table_name", table_name, link, side, params
+            )
+            markers.append(f"""
+            (SELECT MAX({column}) FROM {table_name}{link}) AS {side}_max,
+            (SELECT MAX(last_ddl_time) {objects} AND object_type = 'TABLE') AS {side}_ddl_time,
+            (SELECT SUM(inserts + updates + deletes) {modifications}) AS {side}_dml""")
+        query = f"SELECT {','.join(markers)} FROM DUAL"
+        
+        _, rows = self.target_db.execute_query_rows(query, params, arraysize=1, connection=connection)
+        return hashlib.sha1(repr(rows[0]).encode()).hexdigest()
+    
+    @staticmethod
+    def _dictionary_view(view: str, owner_column: str, name_column: str, table_name: str,
+                         link: str, prefix: str, params: Dict) -> str:
+        """FROM/WHERE clause selecting table_name's rows from a USER_ or ALL_ dictionary view.
+        
+        A schema-qualified table is looked up in the ALL_ view by owner; its binds
+        are added to params under prefix.
+        """
+        owner, _, name = table_name.rpartition('.')
+        params[f"{prefix}_name"] = name
+        if not owner:
+            return f"FROM user_{view}{link} WHERE {name_column} = UPPER(:{prefix}_name)"
+        params[f"{prefix}_owner"] = owner
+        return (f"FROM all_{view}{link} WHERE {owner_column} = UPPER(:{prefix}_owner) "
+                f"AND {name_column} = UPPER(:{prefix}_name)")
+    
     def _get_table_row_count(self, table_name: str, where_clause: Optional[str] = None, 
-                         incremental_mode: bool = False, incremental_column: Optional[str] = None) -> int:
-        """Get the total row count for a table."""
-        query = f"SELECT COUNT(*) as cnt FROM {table_name}@{self.db_link_name}"
+                         incremental_mode: bool = False, incremental_column: Optional[str] = None) -> Tuple[int, bool]:
+        """Get the total row count for a table and whether it is an estimate.
+        
+        An unfiltered count is taken from the source's optimizer statistics when
+        they are recent, avoiding a full scan over the link; otherwise the rows
+        are counted.
+        """
+        if not (where_clause or incremental_mode):
+            estimate = self._get_row_count_estimate(table_name)
+            if estimate is not None:
+                return estimate, True
+        
+        query = f"SELECT COUNT(*) as cnt FROM {table_name}@{self.db_link_name} s WHERE 1=1"
         if where_clause:
-            query += f" WHERE {where_clause}"
+            query += f" AND {where_clause}"
         
         # Apply incremental filter if enabled
-        if incremental_mode and incremental_column:
-            # Get the last run time from previous validation results
-            last_run_time = self._get_last_validation_time(table_name)
-            if last_run_time:
-                where_connector = "WHERE" if "WHERE" not in query else "AND"
-                query += f" {where_connector} {incremental_column} > TO_TIMESTAMP('{last_run_time}', 'YYYY-MM-DD HH24:MI:SS.FF')"
+        incremental_condition, binds = self._get_incremental_condition(table_name, incremental_mode, incremental_column)
+        query += f" {incremental_condition}"
         
         # Use target_db with database link to query the source
-        result = self.target_db.execute_query(query)
-        return result[0]['CNT']
+        result = self._execute_query(query, binds, arraysize=1, input_sizes=self._bind_input_sizes(binds))
+        return result[0]['CNT'], False
+    
+    def _get_row_count_estimate(self, table_name: str) -> Optional[int]:
+        """Row count from the source table's statistics, or None if they are missing or stale."""
+        query = f"""
+        SELECT num_rows
+        FROM user_tables@{self.db_link_name}
+        WHERE table_name = UPPER(:table_name)
+        AND last_analyzed > SYSDATE - :max_age_days
+        """
+        result = self._execute_query(
+            query, {"table_name": table_name, "max_age_days": ROW_COUNT_STATS_MAX_AGE_DAYS}, arraysize=1
+        )
+        return result[0]['NUM_ROWS'] if result else None
+    
+    def _get_end_key(self, target_table: str, natural_keys: List[str]) -> Optional[tuple]:
+        """Get the target's largest natural key, or None if the table is empty.
+        
+        Chunks walk the target in key order, so no chunk can follow the one ending
+        at this key. It is read with one ordered single-row query, which is a min/max
+        index probe when the natural keys are indexed.
+        """
+        query = f"""
+        SELECT {", ".join(natural_keys)}
+        FROM {target_table}
+        ORDER BY {", ".join(f"{key} DESC NULLS LAST" for key in natural_keys)}
+        FETCH FIRST 1 ROWS ONLY
+        """
+        _, rows = self.target_db.execute_query_rows(query, arraysize=1, connection=self._connection)
+        return rows[0] if rows else None
+    
+    @staticmethod
+    def _reached_end_key(last_key_values: Optional[tuple], end_key: Optional[tuple],
+                         natural_keys: List[str], column_info: Dict[str, str]) -> bool:
+        """Whether the typed last key is at or past end_key.
+        
+        Only numeric and DATE keys are compared; string ordering in Python may not
+        match the database's collation, so string keys never end the loop early.
+        """
+        if last_key_values is None or end_key is None:
+            return False
+        if any(column_info.get(key) not in NUMERIC_TYPES + ('DATE',) for key in natural_keys):
+            return False
+        # NULL keys have no order to compare against
+        if None in last_key_values or None in end_key:
+            return False
+        return tuple(last_key_values) >= tuple(end_key)
     
     def _validate_in_chunks(self, mapping: TableMapping, progress_id: int, 
-                           total_rows: int) -> Dict[str, any]:
-        """Validate table data in chunks."""
+                           total_rows: int, total_rows_is_estimate: bool = False) -> Dict[str, any]:
+        """Validate table data in chunks, against a local source snapshot if configured.
+        
+        Unfiltered tables that fit in one chunk are compared with a single query instead.
+        A row count from optimizer statistics may be stale, so it never selects that path.
+        """
+        if (total_rows <= mapping.chunk_size and not total_rows_is_estimate
+                and not (mapping.where_clause or mapping.incremental_mode)):
+            return self._validate_single_shot(mapping, progress_id)
+        
+        if not mapping.source_snapshot:
+            return self._compare_in_chunks(mapping, progress_id)
+        
+        snapshot_table = self._prepare_source_snapshot(mapping)
+        try:
+            return self._compare_in_chunks(mapping, progress_id, snapshot_table)
+        finally:
+            self._release_source_snapshot(snapshot_table)
+    
+    def _validate_single_shot(self, mapping: TableMapping, progress_id: int) -> Dict[str, any]:
+        """Compare a small, unfiltered table with one aggregate query and no pagination.
+        
+        Counts follow the chunked comparison: target rows are classified against
+        the source, and the extra-in-target rows are the target rows that have no
+        source row. The anti-join is only run to fetch extra-row details.
+        """
+        column_info = self._get_column_info(mapping.source_table)
+        columns = [col for col in self._get_table_columns(mapping.source_table)
+                   if col not in mapping.exclude_columns]
+        key_conditions = " AND ".join([f"t.{key} = s.{key}" for key in mapping.natural_keys])
+        comparison_condition = self._comparison_condition(
+            columns, mapping.natural_keys, column_info, mapping.comparison_mode,
+            self._get_column_lengths(mapping.source_table)
+        )
+        
+        hints = mapping.hints
+        if not hints:
+            generated_hints = ["USE_HASH(t s)"]
+            if mapping.driving_site:
+                generated_hints.append(f"DRIVING_SITE({'s' if mapping.driving_site == 'source' else 't'})")
+            if mapping.parallel_degree:
+                generated_hints.append(f"PARALLEL(t, {mapping.parallel_degree}) PARALLEL(s, {mapping.parallel_degree})")
+            hints = " ".join(generated_hints)
+        
+        first_key = mapping.natural_keys[0]
+        query = f"""
+        SELECT /*+ {hints} */
+               COUNT(*) as processed,
+               NVL(SUM(CASE WHEN s.{first_key} IS NULL THEN 1 ELSE 0 END), 0) as missing,
+               NVL(SUM(CASE WHEN s.{first_key} IS NOT NULL AND ({comparison_condition}) THEN 1 ELSE 0 END), 0) as mismatched
+        FROM {mapping.target_table} t
+        LEFT JOIN {mapping.source_table}@{self.db_link_name} s
+            ON {key_conditions}
+        """
+        row = self._execute_query(query, arraysize=1)[0]
+        processed, missing, mismatched = row['PROCESSED'], row['MISSING'], row['MISMATCHED']
+        self.repository.update_progress(progress_id, processed)
+        
+        results = {
+            'matched': processed - missing - mismatched,
+            'mismatched': mismatched,
+            'missing_in_target': missing,
+            'extra_in_target': missing,
+            'mismatch_details': self._collect_mismatch_details(
+                mismatched, missing, "", mapping.source_table, mapping.target_table, mapping.natural_keys
+            )
+        }
+        
+        # Only the extra-row details need the anti-join
+        if missing and self.config and self.config.store_mismatch_details:
+            anti_join = self._extra_in_target_anti_join(
+                mapping.source_table, mapping.target_table, mapping.natural_keys
+            )
+            details = self._get_extra_in_target_details(anti_join, mapping.natural_keys)
+            remaining_capacity = self.config.max_mismatch_details - len(results['mismatch_details'])
+            if remaining_capacity > 0:
+                results['mismatch_details'].extend(details[:remaining_capacity])
+        
+        return results
+    
+    def _prepare_source_snapshot(self, mapping: TableMapping) -> str:
+        """Copy the source table over the link once into a session-private temporary table.
+        
+        The global temporary table is named after the source table's column layout,
+        so a schema change gets a new table, and is created on first use with an
+        index on the natural keys. Rows are private to this validation's session.
+        """
+        columns, column_info = self._get_column_metadata(mapping.source_table)
+        layout = ",".join(f"{col}:{column_info[col]}" for col in columns)
+        signature = hashlib.sha1(f"{mapping.source_table.upper()}|{layout}".encode()).hexdigest()[:16]
+        snapshot_table = f"TMP_SRC_{signature.upper()}"
+        
+        self._create_snapshot_table(mapping, snapshot_table)
+        
+        with self.target_db.get_cursor(self._connection) as cursor:
+            # One bulk pull across the link replaces a remote join per chunk
+            cursor.execute(f"""
+            INSERT /*+ APPEND */ INTO {snapshot_table}
+            SELECT * FROM {mapping.source_table}@{self.db_link_name}
+            """)
+            logger.info(f"Copied {cursor.rowcount} rows of {mapping.source_table} into {snapshot_table}")
+            self._connection.commit()
+        return snapshot_table
+    
+    def _create_snapshot_table(self, mapping: TableMapping, snapshot_table: str):
+        """Create the snapshot table and its key index if they do not exist yet.
+        
+        DDL commits implicitly, so it runs on its own pooled connection rather than
+        the validation's. Concurrent validations may race to create it; losing the
+        race is treated as already created.
+        """
+        with self.target_db.get_cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM user_tables WHERE table_name = :table_name",
+                           {"table_name": snapshot_table})
+            if cursor.fetchone()[0]:
+                return
+            
+            logger.info(f"Creating source snapshot table {snapshot_table} for {mapping.source_table}")
+            statements = [
+                f"""
+                CREATE GLOBAL TEMPORARY TABLE {snapshot_table}
+                ON COMMIT PRESERVE ROWS
+                AS SELECT * FROM {mapping.source_table}@{self.db_link_name} WHERE 1=0
+                """,
+                f"CREATE INDEX {snapshot_table}_IX ON {snapshot_table} ({', '.join(mapping.natural_keys)})"
+            ]
+            for statement in statements:
+                try:
+                    cursor.execute(statement)
+                except oracledb.DatabaseError as e:
+                    error, = e.args
+                    if error.code not in SNAPSHOT_DDL_RACE_ERRORS:
+                        raise
+                    logger.debug(f"Snapshot table {snapshot_table} was created concurrently: {e}")
+    
+    def _release_source_snapshot(self, snapshot_table: str):
+        """Empty the session's copy of a snapshot before the connection returns to the pool."""
+        try:
+            with self.target_db.get_cursor(self._connection) as cursor:
+                cursor.execute(f"TRUNCATE TABLE {snapshot_table}")
+        except Exception as e:
+            logger.warning(f"Could not truncate source snapshot {snapshot_table}: {e}")
+    
+    def _compare_in_chunks(self, mapping: TableMapping, progress_id: int,
+                           snapshot_table: Optional[str] = None) -> Dict[str, any]:
+        """Compare table data chunk by chunk, joining snapshot_table instead of the link if given.
+        
+        Chunks continue until one comes back partial or the target's last key is
+        reached; the source row count may be an estimate, so it does not bound the loop.
+        """
         results = {
             'matched': 0,
             'mismatched': 0,
@@ -162,86 +517,120 @@ class TableValidator:
         # Build natural key condition - reversed s and t references since we're querying from target now
         key_conditions = " AND ".join([f"t.{key} = s.{key}" for key in mapping.natural_keys])
         
+        key_index = mapping.natural_key_index or self._get_key_index(mapping.target_table, mapping.natural_keys)
+        end_key = self._get_end_key(mapping.target_table, mapping.natural_keys)
+        
+        # The incremental filter's bind is the same for every chunk
+        _, incremental_binds = self._get_incremental_condition(
+            mapping.source_table, mapping.incremental_mode, mapping.incremental_column
+        )
+        
         # Execute validation in chunks
         processed_rows = 0
         last_key = None
-        
-        while processed_rows < total_rows:
-            # Build PL/SQL block for this chunk with pagination
-            plsql_block = self._build_chunk_plsql(
-                mapping.source_table,
-                mapping.target_table,
-                columns,
-                mapping.natural_keys,
-                key_conditions,
-                mapping.where_clause,
-                mapping.chunk_size,
-                column_info,
-                last_key,  # Pass last_key for pagination
-                mapping.incremental_mode,
-                mapping.incremental_column
-            )
-            
-            chunk_result = self._execute_chunk_validation(
-                plsql_block, 
-                last_key,
-                mapping.chunk_size
-            )
-            
-            results['matched'] += chunk_result['matched']
-            results['mismatched'] += chunk_result['mismatched']
-            results['missing_in_target'] += chunk_result['missing_in_target']
-            
-            # Collect mismatch details if available and store_mismatch_details is enabled
-            if 'mismatch_details' in chunk_result and self.config and self.config.store_mismatch_details:
-                # Only collect up to the maximum allowed
-                remaining_capacity = self.config.max_mismatch_details - len(results['mismatch_details'])
-                if remaining_capacity > 0:
-                    details_to_add = chunk_result['mismatch_details'][:remaining_capacity]
-                    results['mismatch_details'].extend(details_to_add)
-                    
-                    # Log if we're reaching the limit
-                    if len(results['mismatch_details']) >= self.config.max_mismatch_details:
-                        logger.info(f"Reached maximum mismatch details limit ({self.config.max_mismatch_details})" +
-                                  f" for table {mapping.source_table}")
-            
-            processed_rows += chunk_result['processed']
-            last_key = chunk_result['last_key']
-            
-            # Update progress
-            self.repository.update_progress(progress_id, processed_rows, last_key)
-            
-            if chunk_result['processed'] < mapping.chunk_size:
-                break
+        last_key_values = None
+        key_var_types = [self._key_var_type(column_info.get(key)) for key in mapping.natural_keys]
+        # Block text for the first chunk and for the bind-paginated chunks after it
+        plsql_blocks = {}
+        
+        # Every chunk call runs on one cursor, so the block's parsed statement is reused
+        with self.target_db.get_cursor(self._connection) as chunk_cursor:
+            while True:
+                paginated = last_key_values is not None
+                binds = dict(incremental_binds)
+                if paginated:
+                    binds.update({f"lk{i}": value for i, value in enumerate(last_key_values)})
+                
+                # Build PL/SQL block for this chunk with pagination
+                plsql_block = plsql_blocks.get(paginated)
+                if plsql_block is None:
+                    plsql_block = plsql_blocks[paginated] = self._build_chunk_plsql(
+                        mapping.source_table,
+                        mapping.target_table,
+                        columns,
+                        mapping.natural_keys,
+                        key_conditions,
+                        mapping.where_clause,
+                        mapping.chunk_size,
+                        column_info,
+                        last_key_values,  # Pass the typed last key for pagination
+                        mapping.incremental_mode,
+                        mapping.incremental_column,
+                        mapping.driving_site,
+                        mapping.parallel_degree,
+                        mapping.comparison_mode,
+                        key_index,
+                        snapshot_table,
+                        mapping.hints
+                    )
+                
+                chunk_result = self._execute_chunk_validation(
+                    plsql_block, 
+                    last_key,
+                    mapping.chunk_size,
+                    binds,
+                    mapping.chunks_per_call,
+                    mapping.source_table,
+                    mapping.target_table,
+                    mapping.natural_keys,
+                    chunk_cursor,
+                    collect_details=False,
+                    key_var_types=key_var_types
+                )
+                
+                results['matched'] += chunk_result['matched']
+                results['mismatched'] += chunk_result['mismatched']
+                results['missing_in_target'] += chunk_result['missing_in_target']
+                
+                processed_rows += chunk_result['processed']
+                last_key = chunk_result['last_key']
+                last_key_values = chunk_result['last_key_values']
+                
+                # Update progress
+                self.repository.update_progress(progress_id, processed_rows, last_key)
+                
+                if chunk_result['processed'] < mapping.chunk_size * mapping.chunks_per_call:
+                    break
+                
+                if self._reached_end_key(last_key_values, end_key, mapping.natural_keys, column_info):
+                    # The row count was an overestimate; no target rows remain past this key
+                    break
+        
+        # The detail samples span the whole table, so they are fetched once after the
+        # chunks rather than between them
+        results['mismatch_details'] = self._collect_mismatch_details(
+            results['mismatched'],
+            results['missing_in_target'],
+            "",
+            mapping.source_table,
+            mapping.target_table,
+            mapping.natural_keys
+        )
         
         # Check for extra rows in target
-        extra_result = self._count_extra_in_target(
+        count, details = self._count_extra_in_target(
             mapping.source_table,
             mapping.target_table,
             mapping.natural_keys,
             mapping.incremental_mode,
-            mapping.incremental_column
+            mapping.incremental_column,
+            snapshot_table
         )
+        results['extra_in_target'] = count
         
-        # If we received a tuple with count and details, unpack it
-        if isinstance(extra_result, tuple) and len(extra_result) == 2:
-            count, details = extra_result
-            results['extra_in_target'] = count
-            
-            # Add details if we have capacity and details collection is enabled
-            if self.config and self.config.store_mismatch_details:
-                remaining_capacity = self.config.max_mismatch_details - len(results['mismatch_details'])
-                if remaining_capacity > 0 and details:
-                    details_to_add = details[:remaining_capacity]
-                    results['mismatch_details'].extend(details_to_add)
-        else:
-            # Simple count was returned
-            results['extra_in_target'] = extra_result
+        # Add details if we have capacity and details collection is enabled
+        if self.config and self.config.store_mismatch_details:
+            remaining_capacity = self.config.max_mismatch_details - len(results['mismatch_details'])
+            if remaining_capacity > 0 and details:
+                results['mismatch_details'].extend(details[:remaining_capacity])
         
         return results
     
-    def _get_last_validation_time(self, table_name: str) -> Optional[str]:
+    def _get_last_validation_time(self, table_name: str) -> Optional[datetime]:
         """Get the last validation time for a table."""
+        if table_name in self._last_run_times:
+            return self._last_run_times[table_name]
+        
         query = f"""
         SELECT MAX(completed_at) as last_run
         FROM {self.repository.results_table}
@@ -249,456 +638,556 @@ class TableValidator:
         AND status = 'SUCCESS'
         """
         
-        result = self.repository.db_manager.execute_query(query, {"table_name": table_name})
-        if result and result[0]['LAST_RUN']:
-            return result[0]['LAST_RUN'].strftime("%Y-%m-%d %H:%M:%S.%f")
-        return None
+        result = self._execute_query(query, {"table_name": table_name}, arraysize=1)
+        last_run_time = result[0]['LAST_RUN'] if result else None
+        self._last_run_times[table_name] = last_run_time
+        return last_run_time
     
     def _get_incremental_condition(self, table_name: str, incremental_mode: bool, 
                                  incremental_column: Optional[str], 
-                                 for_extra_target: bool = False) -> str:
-        """Build SQL condition for incremental validation."""
+                                 for_extra_target: bool = False) -> Tuple[str, Dict[str, Any]]:
+        """Build SQL condition for incremental validation and the binds it uses.
+        
+        The last run time is bound as :last_run. For a DATE column it is cast to
+        DATE so the comparison stays on the column's own type and its index.
+        """
         if not (incremental_mode and incremental_column):
-            return ""
+            return "", {}
             
         last_run_time = self._get_last_validation_time(table_name)
         if not last_run_time:
-            return ""
+            return "", {}
             
         # For extra-in-target query, we apply the filter on target table
         table_alias = "t" if for_extra_target else "s"
-        return f"AND {table_alias}.{incremental_column} > TO_TIMESTAMP('{last_run_time}', 'YYYY-MM-DD HH24:MI:SS.FF')"
+        bound_time = ":last_run"
+        if self._get_column_info(table_name).get(incremental_column.upper()) == 'DATE':
+            bound_time = "CAST(:last_run AS DATE)"
+        return f"AND {table_alias}.{incremental_column} > {bound_time}", {"last_run": last_run_time}
+    
+    @staticmethod
+    def _bind_input_sizes(binds: Dict[str, Any]) -> Dict[str, Any]:
+        """Bind types for setinputsizes, so each statement keeps one shared cursor."""
+        input_sizes = {}
+        for name, value in binds.items():
+            if name == "last_run":
+                input_sizes[name] = oracledb.DB_TYPE_TIMESTAMP
+            elif isinstance(value, datetime):
+                input_sizes[name] = oracledb.DB_TYPE_DATE
+            elif isinstance(value, str):
+                input_sizes[name] = KEY_BIND_SIZE
+        return input_sizes
+    
+    def _get_column_metadata(self, table_name: str) -> Tuple[List[str], Dict[str, str]]:
+        """Get a table's column names in column order and their data types, cached per table."""
+        metadata = self._column_metadata.get(table_name)
+        if metadata is None:
+            query = """
+            SELECT column_name, data_type, data_length
+            FROM user_tab_columns@{0} 
+            WHERE table_name = UPPER(:table_name)
+            ORDER BY column_id
+            """.format(self.db_link_name)
+            
+            # Use target_db with database link to get column metadata from source
+            _, rows = self.target_db.execute_query_rows(
+                query, {"table_name": table_name}, connection=self._connection
+            )
+            metadata = ([name for name, _, _ in rows], {name: data_type for name, data_type, _ in rows})
+            self._column_lengths[table_name] = {name: data_length for name, _, data_length in rows}
+            self._column_metadata[table_name] = metadata
+        return metadata
+    
+    def _get_key_index(self, target_table: str, natural_keys: List[str]) -> Optional[str]:
+        """Find a target index whose leading columns are the natural keys, in order.
+        
+        Such an index lets each chunk read its rows in key order instead of sorting.
+        The lookup is only an optimisation, so failures are treated as no index.
+        """
+        cache_key = (target_table, tuple(natural_keys))
+        if cache_key in self._key_indexes:
+            return self._key_indexes[cache_key]
+        
+        # A schema-qualified target may be owned by another schema
+        owner, _, table_name = target_table.rpartition('.')
+        query = f"""
+        SELECT index_name, column_name
+        FROM all_ind_columns
+        WHERE table_owner = {"UPPER(:owner)" if owner else "USER"}
+        AND table_name = UPPER(:table_name)
+        ORDER BY index_name, column_position
+        """
+        params = {"table_name": table_name}
+        if owner:
+            params["owner"] = owner
+        index_name = None
+        try:
+            _, rows = self.target_db.execute_query_rows(query, params, connection=self._connection)
+            index_columns: Dict[str, List[str]] = {}
+            for name, column_name in rows:
+                index_columns.setdefault(name, []).append(column_name)
+            wanted = [key.upper() for key in natural_keys]
+            index_name = next(
+                (name for name, columns in index_columns.items() if columns[:len(wanted)] == wanted), None
+            )
+        except Exception as e:
+            logger.debug(f"Could not look up indexes on {target_table}: {e}")
+            self._key_indexes[cache_key] = None
+            return None
+        
+        if index_name is None:
+            logger.warning(f"No index on {target_table} starts with its natural keys {natural_keys}; "
+                           f"each chunk will sort the table. Consider creating one")
+        self._key_indexes[cache_key] = index_name
+        return index_name
     
     def _get_table_columns(self, table_name: str) -> List[str]:
         """Get all columns for a table."""
-        query = """
-        SELECT column_name 
-        FROM user_tab_columns@{0} 
-        WHERE table_name = UPPER(:table_name)
-        ORDER BY column_id
-        """.format(self.db_link_name)
-        
-        # Use target_db with database link to get column metadata from source
-        result = self.target_db.execute_query(query, {"table_name": table_name})
-        return [row['COLUMN_NAME'] for row in result]
+        return list(self._get_column_metadata(table_name)[0])
     
     def _get_column_info(self, table_name: str) -> Dict[str, str]:
         """Get column names and data types for a table."""
-        query = """
-        SELECT column_name, data_type
-        FROM user_tab_columns@{0} 
-        WHERE table_name = UPPER(:table_name)
-        """.format(self.db_link_name)
-        
-        # Use target_db with database link to get column metadata from source
-        result = self.target_db.execute_query(query, {"table_name": table_name})
-        return {row['COLUMN_NAME']: row['DATA_TYPE'] for row in result}
+        return dict(self._get_column_metadata(table_name)[1])
+    
+    def _get_column_lengths(self, table_name: str) -> Dict[str, int]:
+        """Get column names and declared lengths in bytes for a table."""
+        self._get_column_metadata(table_name)
+        return self._column_lengths.get(table_name, {})
     
-    def _generate_column_checks(self, columns: List[str], natural_keys: List[str], 
-                              target_table: str, source_table: str, db_link_name: str) -> str:
-        """Generate PL/SQL code for checking which columns are mismatched."""
-        # This function creates a cursor to check each column for mismatches
-        # and returns a PL/SQL block that will execute this check
-        
-        cols_to_check = [col for col in columns if col not in natural_keys]
-        if not cols_to_check:
-            return "-- No columns to check\n"
-            
-        # Create a comma-separated list of columns for the query
-        col_list = ', '.join([f"'{col}'" for col in cols_to_check])
-        
-        # Build natural key conditions for the WHERE clause
-        # We need to join the records using natural keys
-        key_conditions_parts = []
-        for key in natural_keys:
-            key_conditions_parts.append(f"t.{key} = s.{key}")
-        key_conditions = " AND ".join(key_conditions_parts)
-        
-        # Build a WHERE clause for the natural key conditions against the current record
-        record_key_conditions_parts = []
-        for key in natural_keys:
-            record_key_conditions_parts.append(f"t.{key} = rec.{key}")
-        record_key_conditions = " AND ".join(record_key_conditions_parts)
-            
-        # Create a PL/SQL block that checks each column
-        # Instead of using ROWTYPE, we directly compare columns between tables
-        plsql = f"""
-        -- For each non-key column, check if it's mismatched
-        FOR check_col IN (
-            SELECT column_name 
-            FROM user_tab_columns 
-            WHERE table_name = UPPER('{target_table}')
-            AND column_name IN ({col_list})
-        ) LOOP
-            -- Check if this column has a mismatch between source and target
-            -- using dynamic SQL since we need to reference columns by name dynamically
-            DECLARE
-                v_is_mismatched NUMBER := 0;
-                v_sql VARCHAR2(4000);
-            BEGIN
-                -- Build dynamic SQL to check for mismatches
-                v_sql := 'SELECT COUNT(*) FROM ' || '{target_table}' || ' t, ' ||
-                         '{source_table}@' || '{db_link_name}' || ' s ' ||
-                         'WHERE ' || '{key_conditions}' || ' AND ' || '{record_key_conditions}' || ' AND ' ||
-                         '(t.' || check_col.column_name || ' != s.' || check_col.column_name || 
-                         ' OR (t.' || check_col.column_name || ' IS NULL AND s.' || check_col.column_name || ' IS NOT NULL)' ||
-                         ' OR (t.' || check_col.column_name || ' IS NOT NULL AND s.' || check_col.column_name || ' IS NULL))';
-                
-                -- Execute the dynamic SQL
-                EXECUTE IMMEDIATE v_sql INTO v_is_mismatched;
-                
-                -- If mismatched, add to our collection
-                IF v_is_mismatched > 0 THEN
-                    -- Add the column to our mismatched columns collection
-                    v_columns(v_detail_count) := check_col.column_name;
-                    EXIT; -- We only need one representative column for the detail
-                END IF;
-            EXCEPTION
-                WHEN OTHERS THEN
-                    -- Log the error but continue with other columns
-                    v_columns(v_detail_count) := 'ERROR: ' || SQLERRM;
-                    EXIT;
-            END;
-        END LOOP;
-        """
-        
-        return plsql
-
     def _build_chunk_plsql(self, source_table: str, target_table: str,
                           columns: List[str], natural_keys: List[str],
                           key_conditions: str, where_clause: Optional[str],
                           chunk_size: int, column_info: Dict[str, str],
-                          last_key: Optional[str] = None, 
+                          last_key_values: Optional[tuple] = None,
                           incremental_mode: bool = False,
-                          incremental_column: Optional[str] = None) -> str:
+                          incremental_column: Optional[str] = None,
+                          driving_site: Optional[str] = None,
+                          parallel_degree: Optional[int] = None,
+                          comparison_mode: str = "columns",
+                          key_index: Optional[str] = None,
+                          snapshot_table: Optional[str] = None,
+                          hints: Optional[str] = None) -> str:
         """Build PL/SQL block for chunk-based comparison.
         
         Note: When using database links in Oracle, avoid using %ROWTYPE references
         as they can cause type mismatch errors (DPY-2007). Instead, use direct column
         references or dynamic SQL for column comparisons.
-        """
         
-        # Build column comparison conditions - reversed s and t references
-        column_comparisons = []
-        for col in columns:
-            if col not in natural_keys:
-                # Build the comparison based on data type
-                if column_info.get(col) in ['VARCHAR2', 'CHAR', 'CLOB']:
-                    # String comparison
-                    comparison = f"""
-                    (t.{col} IS NULL AND s.{col} IS NOT NULL) OR 
-                    (t.{col} IS NOT NULL AND s.{col} IS NULL) OR 
-                    (t.{col} IS NOT NULL AND s.{col} IS NOT NULL AND t.{col} != s.{col})
-                    """.strip()
-                else:
-                    # Numeric/Date comparison  
-                    comparison = f"""
-                    (t.{col} IS NULL AND s.{col} IS NOT NULL) OR 
-                    (t.{col} IS NOT NULL AND s.{col} IS NULL) OR 
-                    (t.{col} != s.{col})
-                    """.strip()
-                column_comparisons.append(f"({comparison})")
+        With comparison_mode "hash" the non-LOB columns are compared through
+        SHA-256 hashes of column groups instead of one condition per column. If
+        snapshot_table is given it is joined in place of the source over the link.
+        hints, if given, replaces the generated optimizer hints for the chunk query.
+        """
         
-        comparison_condition = " OR ".join(column_comparisons) if column_comparisons else "1=0"
+        comparison_condition = self._comparison_condition(
+            columns, natural_keys, column_info, comparison_mode, self._get_column_lengths(source_table)
+        )
         
         # Build key ordering for pagination - using target (t) columns now
         key_ordering = ", ".join([f"t.{key}" for key in natural_keys])
-        key_values = ", ".join([f"t.{key}" for key in natural_keys])
-        
-        # Build pagination condition if last_key is provided
-        pagination_condition = ""
-        if last_key:
-            # Parse last_key to build condition (using our delimiter)
-            key_parts = last_key.split('~|~')
-            if len(key_parts) == len(natural_keys):
-                # Build proper pagination condition for composite keys
-                pagination_conditions = []
-                for i in range(len(natural_keys)):
-                    conditions = []
-                    # Add equality conditions for all previous keys
-                    for j in range(i):
-                        key_name = natural_keys[j]
-                        key_value = key_parts[j].strip()
-                        
-                        # Format the value based on data type - using target (t) columns now
-                        if column_info.get(key_name) in ['VARCHAR2', 'CHAR', 'CLOB']:
-                            conditions.append(f"t.{key_name} = '{key_value}'")
-                        elif column_info.get(key_name) == 'DATE':
-                            conditions.append(f"t.{key_name} = TO_DATE('{key_value}', 'YYYY-MM-DD HH24:MI:SS')")
-                        else:  # Numeric
-                            conditions.append(f"t.{key_name} = {key_value}")
-                    
-                    # Add greater than condition for current key
-                    key_name = natural_keys[i]
-                    key_value = key_parts[i].strip()
-                    
-                    if column_info.get(key_name) in ['VARCHAR2', 'CHAR', 'CLOB']:
-                        conditions.append(f"t.{key_name} > '{key_value}'")
-                    elif column_info.get(key_name) == 'DATE':
-                        conditions.append(f"t.{key_name} > TO_DATE('{key_value}', 'YYYY-MM-DD HH24:MI:SS')")
-                    else:  # Numeric
-                        conditions.append(f"t.{key_name} > {key_value}")
-                    
-                    if conditions:
-                        pagination_conditions.append(f"({' AND '.join(conditions)})")
-                
-                if pagination_conditions:
-                    pagination_condition = f"AND ({' OR '.join(pagination_conditions)})"
         
-        # Build key value formatting for last_key
+        incremental_condition, _ = self._get_incremental_condition(source_table, incremental_mode, incremental_column)
+        
+        # Keyset pagination on the PL/SQL variables v_lk0..v_lkN holding the previous
+        # chunk's last key. They start from the :lk0..:lkN binds when last_key_values
+        # is given, so every chunk after the first runs the same statement text. Oracle
+        # has no row-value comparison, so (k1, k2, ...) > (v_lk0, v_lk1, ...) is
+        # expanded into its OR-of-ANDs form
+        paginated = last_key_values is not None
+        key_vars = [f"v_lk{i}" for i in range(len(natural_keys))]
+        pagination_conditions = []
+        for i in range(len(natural_keys)):
+            # Equality on all previous keys, greater than on the current key
+            conditions = [f"t.{natural_keys[j]} = {key_vars[j]}" for j in range(i)]
+            conditions.append(f"t.{natural_keys[i]} > {key_vars[i]}")
+            pagination_conditions.append(f"({' AND '.join(conditions)})")
+        pagination_condition = f"AND ({' OR '.join(pagination_conditions)})"
+        if len(natural_keys) > 1:
+            # Redundant, but gives the optimizer an index range start on the leading key
+            pagination_condition = f"AND t.{natural_keys[0]} >= {key_vars[0]} {pagination_condition}"
+        
+        key_declarations = "\n            ".join(
+            f"v_lk{i} {target_table}.{key}%TYPE{f' := :lk{i}' if paginated else ''};"
+            for i, key in enumerate(natural_keys)
+        )
+        
+        # Build key value formatting for last_key, in the formats the pagination condition parses
         key_formatting = []
         for key in natural_keys:
             if column_info.get(key) == 'DATE':
-                key_formatting.append(f"TO_CHAR(rec.{key}, 'YYYY-MM-DD HH24:MI:SS')")
+                key_formatting.append(f"TO_CHAR(t.{key}, 'YYYY-MM-DD HH24:MI:SS')")
             else:
-                key_formatting.append(f"TO_CHAR(rec.{key})")
-        # Note: rec contains target table columns since we're querying from target
+                key_formatting.append(f"TO_CHAR(t.{key})")
         
         last_key_concat = " || '~|~' || ".join(key_formatting)
         
-        # Add the column-specific mismatches for detailed reporting
-        column_mismatch_clauses = []
-        for col in columns:
-            if col not in natural_keys:
-                # Don't include comparison in the main SELECT to avoid cartesian product
-                column_mismatch_clauses.append(f"""
-                WHEN '{col}' THEN
-                    CASE 
-                        WHEN t.{col} IS NULL AND s.{col} IS NOT NULL THEN 'Target NULL, Source: ' || s.{col}
-                        WHEN t.{col} IS NOT NULL AND s.{col} IS NULL THEN 'Target: ' || t.{col} || ', Source NULL'
-                        WHEN t.{col} != s.{col} THEN 'Target: ' || t.{col} || ', Source: ' || s.{col}
-                        ELSE NULL
-                    END
-                """)
-        
-        column_mismatch_case = "NULL" if not column_mismatch_clauses else f"""
-        CASE c.col_name
-        {' '.join(column_mismatch_clauses)}
-        ELSE NULL
-        END
-        """
-        
-        # Aggregate the natural key values as a JSON-like string
-        key_json_elements = []
-        for key in natural_keys:
-            key_json_elements.append(f"'{key}:' || t.{key}")
-        
-        key_json = " || ',' || ".join(key_json_elements)
-        
-        # Generate column check code
-        column_checks = self._generate_column_checks(columns, natural_keys, target_table, source_table, self.db_link_name)
-        max_details = self.config.max_mismatch_details if hasattr(self, 'config') and self.config else 1000
-        
-        # Generate the join conditions for key checks
-        join_conditions = ' '.join([f"AND t.{key} = rec.{key}" for key in natural_keys])
-        
-        # Format the JSON key string differently to avoid f-string nesting issues
-        key_json_expr = " || ',' || ".join([f"'{key}:' || t.{key}" for key in natural_keys])
-        
         # Log the plsql generation for debugging
         logger.debug(f"Generating simplified PL/SQL for {target_table} validation with {source_table}@{self.db_link_name}")
         
-        # Create PL/SQL that avoids using ROWTYPE with database links
-        plsql = f"""
-        DECLARE
-            v_matched NUMBER := 0;
-            v_mismatched NUMBER := 0;
-            v_missing NUMBER := 0;
-            v_processed NUMBER := 0;
-            v_last_key VARCHAR2(4000);
-            v_detail_count NUMBER := 0;
-            v_key_value VARCHAR2(4000);
-            
-            -- Simple cursor that directly checks for mismatches between source and target
-            -- We need to specify column aliases to avoid duplicate column names
-            CURSOR c_data IS
-                SELECT 
-                    {", ".join([f"t.{col} as t_{col}" for col in columns])},
-                    {", ".join([f"s.{col} as s_{col}" for col in columns])},
+        # Optimizer hints: optimize for returning the chunk's rows in key order, and run
+        # the join at the chosen site and/or with parallel query, unless the mapping
+        # pins its own hints
+        if not hints:
+            generated_hints = [f"FIRST_ROWS({chunk_size})"]
+            if key_index:
+                # Walk the natural key index in order so the chunk needs no sort
+                generated_hints.append(f"INDEX_ASC(t {key_index})")
+            if driving_site:
+                generated_hints.append(f"DRIVING_SITE({'s' if driving_site == 'source' else 't'})")
+            if parallel_degree:
+                generated_hints.append(f"PARALLEL(t, {parallel_degree}) PARALLEL(s, {parallel_degree})")
+            hints = " ".join(generated_hints)
+        hint = f"/*+ {hints} */"
+        
+        # Classify and count a chunk's rows in one set-based SELECT INTO rather than a
+        # row-by-row cursor loop. The last key is taken from the row that sorts last,
+        # matching the chunk's ORDER BY, both as the reported string and as typed values
+        # for the next chunk's pagination
+        last_row = f"KEEP (DENSE_RANK LAST ORDER BY {', '.join([f't_{key}' for key in natural_keys])})"
+        last_values = ", ".join(
+            [f"MAX({col}) {last_row}" for col in ['row_key'] + [f"t_{key}" for key in natural_keys]]
+        )
+        
+        def chunk_select(with_pagination: bool) -> str:
+            return f"""
+            SELECT COUNT(*),
+                   NVL(SUM(CASE WHEN status = 'MATCH' THEN 1 ELSE 0 END), 0),
+                   NVL(SUM(CASE WHEN status = 'MISMATCH' THEN 1 ELSE 0 END), 0),
+                   NVL(SUM(CASE WHEN status = 'MISSING' THEN 1 ELSE 0 END), 0),
+                   {last_values}
+            INTO c_processed, c_matched, c_mismatched, c_missing, c_last_key, {", ".join(key_vars)}
+            FROM (
+                SELECT {hint}
+                    {", ".join([f"t.{key} as t_{key}" for key in natural_keys])},
+                    {last_key_concat} as row_key,
                     CASE 
                         WHEN s.{natural_keys[0]} IS NULL THEN 'MISSING'
                         WHEN {comparison_condition} THEN 'MISMATCH'
                         ELSE 'MATCH'
                     END as status
                 FROM {target_table} t
-                LEFT JOIN {source_table}@{self.db_link_name} s
+                LEFT JOIN {snapshot_table or f"{source_table}@{self.db_link_name}"} s
                     ON {key_conditions}
                 WHERE 1=1
                 {f"AND {where_clause}" if where_clause else ""}
-                {self._get_incremental_condition(source_table, incremental_mode, incremental_column)}
-                {pagination_condition}
+                {incremental_condition}
+                {pagination_condition if with_pagination else ""}
                 ORDER BY {key_ordering}
-                FETCH FIRST {chunk_size} ROWS ONLY;
-                
+                FETCH FIRST {chunk_size} ROWS ONLY
+            );
+            
+            v_chunks := v_chunks + 1;
+            v_processed := v_processed + c_processed;
+            v_matched := v_matched + c_matched;
+            v_mismatched := v_mismatched + c_mismatched;
+            v_missing := v_missing + c_missing;
+            IF c_processed > 0 THEN
+                v_last_key := c_last_key;
+            END IF;
+            """
+        
+        # The typed last key is returned through :next_lk0..:next_lkN for the next call's binds
+        next_key_outputs = "\n            ".join(f":next_lk{i} := v_lk{i};" for i in range(len(natural_keys)))
+        
+        # Up to :n_chunks consecutive chunks run in one call, stopping early at a
+        # partial chunk, so fast tables are not dominated by round-trip latency
+        plsql = f"""
+        DECLARE
+            v_chunks NUMBER := 0;
+            v_processed NUMBER := 0;
+            v_matched NUMBER := 0;
+            v_mismatched NUMBER := 0;
+            v_missing NUMBER := 0;
+            v_last_key VARCHAR2(4000);
+            c_processed NUMBER;
+            c_matched NUMBER;
+            c_mismatched NUMBER;
+            c_missing NUMBER;
+            c_last_key VARCHAR2(4000);
+            {key_declarations}
         BEGIN
-            -- Process each row using direct SQL comparison
-            FOR rec IN c_data LOOP
-                v_processed := v_processed + 1;
-                
-                -- Construct the last key value for pagination
-                v_key_value := NULL;
-                {" || '~|~' || ".join([f"v_key_value := COALESCE(v_key_value || '~|~', '') || TO_CHAR(rec.t_{key})" for key in natural_keys])};
-                v_last_key := v_key_value;
-                
-                IF rec.status = 'MATCH' THEN
-                    v_matched := v_matched + 1;
-                ELSIF rec.status = 'MISMATCH' THEN
-                    v_mismatched := v_mismatched + 1;
-                ELSIF rec.status = 'MISSING' THEN
-                    v_missing := v_missing + 1;
-                END IF;
+            {chunk_select(paginated)}
+            
+            WHILE v_chunks < :n_chunks AND c_processed = {chunk_size} LOOP
+                {chunk_select(True)}
             END LOOP;
             
-            -- Return results via OUT parameters
+            :processed := v_processed;
             :matched := v_matched;
             :mismatched := v_mismatched;
             :missing := v_missing;
-            :processed := v_processed;
             :last_key := v_last_key;
-            :detail_count := v_detail_count;
+            {next_key_outputs}
+            :detail_count := 0;
         END;
         """
         
         return plsql
     
+    def _comparison_condition(self, columns: List[str], natural_keys: List[str],
+                              column_info: Dict[str, str], comparison_mode: str = "columns",
+                              column_lengths: Optional[Dict[str, int]] = None) -> str:
+        """Condition that is true when a joined t/s row pair differs in a non-key column.
+        
+        In hash mode the non-LOB columns are hashed in groups whose text fits in
+        MAX_HASH_INPUT_BYTES, judged from column_lengths; a column too wide to fit
+        on its own is compared individually.
+        """
+        # Build column comparison conditions - reversed s and t references
+        column_comparisons = []
+        hash_groups = []
+        group_bytes = MAX_HASH_INPUT_BYTES
+        for col in columns:
+            if col not in natural_keys:
+                data_type = column_info.get(col)
+                if comparison_mode == "hash" and data_type not in LOB_TYPES:
+                    text_bytes = self._hash_text_bytes(data_type, (column_lengths or {}).get(col))
+                    if text_bytes <= MAX_HASH_INPUT_BYTES:
+                        if group_bytes + text_bytes > MAX_HASH_INPUT_BYTES:
+                            hash_groups.append([])
+                            group_bytes = 0
+                        hash_groups[-1].append(col)
+                        group_bytes += text_bytes
+                        continue
+                
+                column_comparisons.append(self._column_differs(col, data_type))
+        
+        column_comparisons[:0] = [
+            f"STANDARD_HASH({self._row_hash_input('t', group, column_info)}, 'SHA256') != "
+            f"STANDARD_HASH({self._row_hash_input('s', group, column_info)}, 'SHA256')"
+            for group in hash_groups
+        ]
+        
+        return " OR ".join(column_comparisons) if column_comparisons else "1=0"
+    
+    @staticmethod
+    def _hash_text_bytes(data_type: Optional[str], data_length: Optional[int]) -> int:
+        """Upper bound on the bytes a column adds to a row hash input, with its prefix and separator."""
+        data_type = data_type or ''
+        if data_length is None:
+            return MAX_HASH_INPUT_BYTES + 1
+        if data_type == 'DATE':
+            text_bytes = 19
+        elif data_type.startswith('TIMESTAMP'):
+            text_bytes = 29
+        elif data_type in ('VARCHAR2', 'CHAR'):
+            text_bytes = data_length
+        elif data_type in NUMERIC_TYPES or data_type.startswith('INTERVAL'):
+            # TO_CHAR of a number is at most 40 digits with a sign, point and exponent
+            text_bytes = 64
+        else:
+            # National character sets and hex-encoded RAW can double in size as text
+            text_bytes = 2 * data_length
+        # 'v'/'n' prefix and the separator
+        return text_bytes + 2
+    
+    @staticmethod
+    def _column_differs(col: str, data_type: Optional[str]) -> str:
+        """Null-safe "t.col differs from s.col" condition.
+        
+        DECODE treats two NULLs as equal, so one comparison covers the NULL
+        cases for every non-LOB type. LOBs cannot be compared with
+        operators, so they compare their NULL-ness and then their contents
+        with DBMS_LOB.COMPARE, which is NULL if either side is.
+        """
+        if data_type in LOB_TYPES:
+            return (f"(NVL2(t.{col}, 1, 0) != NVL2(s.{col}, 1, 0) OR "
+                    f"DBMS_LOB.COMPARE(t.{col}, s.{col}) != 0)")
+        return f"DECODE(t.{col}, s.{col}, 0, 1) = 1"
+    
+    @staticmethod
+    def _row_hash_input(alias: str, columns: List[str], column_info: Dict[str, str]) -> str:
+        """Concatenate columns as canonical text for hashing, with NULL kept distinct from values."""
+        parts = []
+        for col in columns:
+            data_type = column_info.get(col) or ''
+            if data_type == 'DATE':
+                text = f"TO_CHAR({alias}.{col}, 'YYYY-MM-DD HH24:MI:SS')"
+            elif data_type.startswith('TIMESTAMP'):
+                text = f"TO_CHAR({alias}.{col}, 'YYYY-MM-DD HH24:MI:SS.FF9')"
+            elif data_type in ('VARCHAR2', 'CHAR', 'NVARCHAR2', 'NCHAR'):
+                text = f"{alias}.{col}"
+            else:
+                text = f"TO_CHAR({alias}.{col})"
+            # Prefix values so a NULL never hashes like a real value
+            parts.append(f"NVL2({alias}.{col}, 'v' || {text}, 'n')")
+        return f" || {ROW_HASH_SEPARATOR} || ".join(parts)
+    
+    @staticmethod
+    def _key_var_type(data_type: Optional[str]) -> Any:
+        """Variable type that returns a natural key column's values unconverted."""
+        if data_type == 'DATE':
+            return oracledb.DB_TYPE_DATE
+        if data_type in NUMERIC_TYPES:
+            return Decimal
+        return str
+    
     def _execute_chunk_validation(self, plsql_block: str, last_key: Optional[str],
-                                 chunk_size: int) -> Dict[str, any]:
-        """Execute validation for a single chunk."""
+                                 chunk_size: int, binds: Optional[Dict[str, Any]] = None,
+                                 chunks_per_call: int = 1, source_table: Optional[str] = None,
+                                 target_table: Optional[str] = None,
+                                 natural_keys: Optional[List[str]] = None,
+                                 cursor=None, collect_details: bool = True,
+                                 key_var_types: Optional[List[Any]] = None) -> Dict[str, any]:
+        """Execute validation for up to chunks_per_call consecutive chunks.
+        
+        binds holds the values for the block's input placeholders: the :lk0..:lkN
+        pagination keys and the incremental :last_run. The tables and keys used for
+        mismatch details are read from the block when not given. cursor, if given,
+        is reused instead of opening one on the validation's connection. With
+        collect_details False the caller collects mismatch details itself.
+        key_var_types gives the variable type of each natural key for the block's
+        :next_lk0..:next_lkN outputs, which are returned as last_key_values.
+        """
         # Changed to use target_db for executing validation since the DB link is on target
-        with self.target_db.get_connection() as connection:
-            with self.target_db.get_cursor(connection) as cursor:
-                # Prepare output variables
-                matched = cursor.var(int)
-                mismatched = cursor.var(int)
-                missing = cursor.var(int)
-                processed = cursor.var(int)
-                last_key_var = cursor.var(str)
-                
-                # Variables for mismatch details - simplified for testing
-                # Just use a count variable, no arrays needed for simplified test
-                detail_count = cursor.var(int)
-                
-                # Build parameters - simplified for testing
-                params = {
-                    "matched": matched,
-                    "mismatched": mismatched,
-                    "missing": missing,
-                    "processed": processed,
-                    "last_key": last_key_var,
-                    "detail_count": detail_count
-                }
-                
-                # Log the first 500 characters of the PL/SQL block for debugging
-                logger.debug(f"Executing chunk validation with plsql_block preview: {plsql_block[:500]}...")
+        with nullcontext(cursor) if cursor is not None else self.target_db.get_cursor(self._connection) as cursor:
+            # Prepare output variables
+            matched = cursor.var(int)
+            mismatched = cursor.var(int)
+            missing = cursor.var(int)
+            processed = cursor.var(int)
+            last_key_var = cursor.var(str)
+            
+            # Variables for mismatch details - simplified for testing
+            # Just use a count variable, no arrays needed for simplified test
+            detail_count = cursor.var(int)
+            
+            next_keys = [
+                cursor.var(var_type, KEY_BIND_SIZE) if var_type is str else cursor.var(var_type)
+                for var_type in key_var_types or []
+            ]
+            
+            # Build parameters - simplified for testing
+            params = {
+                "matched": matched,
+                "mismatched": mismatched,
+                "missing": missing,
+                "processed": processed,
+                "last_key": last_key_var,
+                "detail_count": detail_count,
+                "n_chunks": chunks_per_call
+            }
+            params.update({f"next_lk{i}": var for i, var in enumerate(next_keys)})
+            if binds:
+                cursor.setinputsizes(**self._bind_input_sizes(binds))
+                params.update(binds)
+            
+            # Log the first 500 characters of the PL/SQL block for debugging
+            logger.debug(f"Executing chunk validation with plsql_block preview: {plsql_block[:500]}...")
+            
+            try:
+                logger.debug("Executing main PL/SQL block")
+                cursor.execute(plsql_block, params)
+                logger.debug("PL/SQL execution completed successfully")
+            
+            except Exception as e:
+                # Log the error with specific details
+                logger.error(f"Error executing PL/SQL: {str(e)}")
+                # Log a larger portion of the PL/SQL if there's an error
+                error_context = plsql_block[:min(len(plsql_block), 5000)]
+                logger.error(f"PL/SQL causing error (fragment): {error_context}")
+                raise
+            
+            # Log all variable values
+            logger.debug("Getting variable values from PL/SQL execution")
+            matched_val = matched.getvalue()
+            mismatched_val = mismatched.getvalue()
+            missing_val = missing.getvalue()
+            processed_val = processed.getvalue()
+            last_key_val = last_key_var.getvalue()
+            detail_count_val = detail_count.getvalue() or 0
+            
+            logger.debug(f"Variable values - matched: {matched_val}, mismatched: {mismatched_val}, " +
+                       f"missing: {missing_val}, processed: {processed_val}, last_key: {last_key_val}")
+            
+            mismatch_details = []
+            if collect_details:
+                mismatch_details = self._collect_mismatch_details(
+                    mismatched_val, missing_val, plsql_block, source_table, target_table, natural_keys
+                )
+            
+            logger.debug("Returning results from chunk validation")
+            return {
+                "matched": matched_val,
+                "mismatched": mismatched_val,
+                "missing_in_target": missing_val,
+                "processed": processed_val,
+                "last_key": last_key_val,
+                "last_key_values": tuple(var.getvalue() for var in next_keys) if next_keys and processed_val else None,
+                "mismatch_details": mismatch_details
+            }
+    
+    def _collect_mismatch_details(self, mismatched_val: int, missing_val: int, plsql_block: str,
+                                  source_table: Optional[str], target_table: Optional[str],
+                                  natural_keys: Optional[List[str]]) -> List[Dict]:
+        """Fetch sample mismatched and missing rows if details are configured and any were found.
+        
+        The samples are drawn from the whole table, not a single chunk.
+        """
+        # Get mismatch details using a separate query instead of PL/SQL arrays
+        # This avoids the ORA-06513 error completely
+        mismatch_details = []
+        
+        # Only get details if there are mismatches and we're configured to store them
+        if (mismatched_val > 0 or missing_val > 0) and hasattr(self, 'config') and self.config and self.config.store_mismatch_details:
+            # Get a few sample mismatched and missing rows for detail
+            max_details_to_get = min(20, self.config.max_mismatch_details)  # Limit to reasonable number
+            try:
+                # Extract table and key information from the PL/SQL block
+                source_table = source_table or self._extract_table_from_plsql(plsql_block, "source_table")
+                target_table = target_table or self._extract_table_from_plsql(plsql_block, "target_table")
+                natural_keys = natural_keys or self._extract_natural_keys_from_plsql(plsql_block)
                 
-                try:
-                    # Execute simple test before the actual PL/SQL
-                    logger.debug("Executing simple test before main PL/SQL")
-                    cursor.execute("""
-                    BEGIN
-                       :out_var := 42;
-                    END;
-                    """, {"out_var": detail_count})
-                    test_result = detail_count.getvalue()
-                    logger.debug(f"Simple test result: {test_result}")
-                    
-                    # Now execute the actual PL/SQL block
-                    logger.debug("Executing main PL/SQL block")
-                    cursor.execute(plsql_block, params)
-                    logger.debug("PL/SQL execution completed successfully")
+                # Check if we have enough information to proceed
+                if (source_table.startswith("UNKNOWN") or 
+                    target_table.startswith("UNKNOWN") or 
+                    not natural_keys):
+                    # If we couldn't extract the necessary information, create a generic mismatch detail
+                    logger.warning("Could not extract table information from PL/SQL block")
+                    if mismatched_val > 0:
+                        mismatch_details.append({
+                            "key_values": "{}",
+                            "mismatch_type": "COLUMN_MISMATCH",
+                            "column_name": "UNKNOWN",
+                            "source_value": f"Mismatched rows: {mismatched_val}",
+                            "target_value": "Could not extract detailed information"
+                        })
+                    if missing_val > 0:
+                        mismatch_details.append({
+                            "key_values": "{}",
+                            "mismatch_type": "MISSING_IN_TARGET",
+                            "column_name": None,
+                            "source_value": f"Missing rows: {missing_val}",
+                            "target_value": None
+                        })
+                else:
+                    # Collect column mismatch details with direct SQL
+                    if mismatched_val > 0:
+                        mismatch_details.extend(
+                            self._get_column_mismatch_details(
+                                mapping_source_table=source_table,
+                                mapping_target_table=target_table,
+                                natural_keys=natural_keys,
+                                limit=max_details_to_get // 2  # Split the limit between different types
+                            )
+                        )
                     
-                except Exception as e:
-                    # Log the error with specific details
-                    logger.error(f"Error executing PL/SQL: {str(e)}")
-                    # Log a larger portion of the PL/SQL if there's an error
-                    error_context = plsql_block[:min(len(plsql_block), 5000)]
-                    logger.error(f"PL/SQL causing error (fragment): {error_context}")
-                    raise
-                
-                # Log all variable values
-                logger.debug("Getting variable values from PL/SQL execution")
-                matched_val = matched.getvalue()
-                mismatched_val = mismatched.getvalue()
-                missing_val = missing.getvalue()
-                processed_val = processed.getvalue()
-                last_key_val = last_key_var.getvalue()
-                detail_count_val = detail_count.getvalue() or 0
-                
-                logger.debug(f"Variable values - matched: {matched_val}, mismatched: {mismatched_val}, " +
-                           f"missing: {missing_val}, processed: {processed_val}, last_key: {last_key_val}")
-                
-                # Get mismatch details using a separate query instead of PL/SQL arrays
-                # This avoids the ORA-06513 error completely
-                mismatch_details = []
-                
-                # Only get details if there are mismatches and we're configured to store them
-                if (mismatched_val > 0 or missing_val > 0) and hasattr(self, 'config') and self.config and self.config.store_mismatch_details:
-                    # Get a few sample mismatched and missing rows for detail
-                    max_details_to_get = min(20, self.config.max_mismatch_details)  # Limit to reasonable number
-                    try:
-                        # Extract table and key information from the PL/SQL block
-                        source_table = self._extract_table_from_plsql(plsql_block, "source_table")
-                        target_table = self._extract_table_from_plsql(plsql_block, "target_table")
-                        natural_keys = self._extract_natural_keys_from_plsql(plsql_block)
-                        
-                        # Check if we have enough information to proceed
-                        if (source_table.startswith("UNKNOWN") or 
-                            target_table.startswith("UNKNOWN") or 
-                            not natural_keys):
-                            # If we couldn't extract the necessary information, create a generic mismatch detail
-                            logger.warning("Could not extract table information from PL/SQL block")
-                            if mismatched_val > 0:
-                                mismatch_details.append({
-                                    "key_values": "{}",
-                                    "mismatch_type": "COLUMN_MISMATCH",
-                                    "column_name": "UNKNOWN",
-                                    "source_value": f"Mismatched rows: {mismatched_val}",
-                                    "target_value": "Could not extract detailed information"
-                                })
-                            if missing_val > 0:
-                                mismatch_details.append({
-                                    "key_values": "{}",
-                                    "mismatch_type": "MISSING_IN_TARGET",
-                                    "column_name": None,
-                                    "source_value": f"Missing rows: {missing_val}",
-                                    "target_value": None
-                                })
-                        else:
-                            # Collect column mismatch details with direct SQL
-                            if mismatched_val > 0:
-                                mismatch_details.extend(
-                                    self._get_column_mismatch_details(
-                                        mapping_source_table=source_table,
-                                        mapping_target_table=target_table,
-                                        natural_keys=natural_keys,
-                                        limit=max_details_to_get // 2  # Split the limit between different types
-                                    )
-                                )
-                            
-                            # Collect missing row details
-                            if missing_val > 0:
-                                mismatch_details.extend(
-                                    self._get_missing_row_details(
-                                        mapping_source_table=source_table,
-                                        mapping_target_table=target_table,
-                                        natural_keys=natural_keys,
-                                        limit=max_details_to_get // 2
-                                    )
-                                )
-                    except Exception as e:
-                        # If detail collection fails, log but continue
-                        logger.warning(f"Error collecting column mismatch details: {e}")
-                        logger.info("Continuing validation without column mismatch details")
-                
-                logger.debug("Returning results from chunk validation")
-                return {
-                    "matched": matched_val,
-                    "mismatched": mismatched_val,
-                    "missing_in_target": missing_val,
-                    "processed": processed_val,
-                    "last_key": last_key_val,
-                    "mismatch_details": mismatch_details
-                }
+                    # Collect missing row details
+                    if missing_val > 0:
+                        mismatch_details.extend(
+                            self._get_missing_row_details(
+                                mapping_source_table=source_table,
+                                mapping_target_table=target_table,
+                                natural_keys=natural_keys,
+                                limit=max_details_to_get // 2
+                            )
+                        )
+            except Exception as e:
+                # If detail collection fails, log but continue
+                logger.warning(f"Error collecting column mismatch details: {e}")
+                logger.info("Continuing validation without column mismatch details")
+        
+        return mismatch_details
     
     def _extract_table_from_plsql(self, plsql_block: str, table_var_name: str) -> str:
         """Extract a table name from the PL/SQL block."""
@@ -828,13 +1317,11 @@ class TableValidator:
         
         # Build comparison conditions for all columns 
         # We'll use a CASE expression to identify which column is mismatched
+        _, column_info = self._get_column_metadata(mapping_source_table)
         comparison_conditions = []
         for col in non_key_columns:
             comparison_conditions.append(
-                f"""WHEN ((t.{col} IS NULL AND s.{col} IS NOT NULL) OR 
-                       (t.{col} IS NOT NULL AND s.{col} IS NULL) OR 
-                       (t.{col} IS NOT NULL AND s.{col} IS NOT NULL AND t.{col} != s.{col}))
-                    THEN '{col}'"""
+                f"WHEN {self._column_differs(col, column_info.get(col))} THEN '{col}'"
             )
         
         column_case = "NULL" if not comparison_conditions else f"""
@@ -848,13 +1335,7 @@ class TableValidator:
         join_condition = " AND ".join([f"t.{key} = s.{key}" for key in natural_keys])
         
         # Build comparison conditions for WHERE clause
-        where_conditions = []
-        for col in non_key_columns:
-            where_conditions.append(f"""(
-                (t.{col} IS NULL AND s.{col} IS NOT NULL) OR 
-                (t.{col} IS NOT NULL AND s.{col} IS NULL) OR 
-                (t.{col} IS NOT NULL AND s.{col} IS NOT NULL AND t.{col} != s.{col})
-            )""")
+        where_conditions = [self._column_differs(col, column_info.get(col)) for col in non_key_columns]
             
         # Handle the case where we have no conditions (should never happen)
         if not where_conditions:
@@ -882,7 +1363,7 @@ class TableValidator:
         try:
             # Execute the query to get mismatch details
             logger.debug(f"Executing mismatch details query: {query[:500]}...")
-            results = self.target_db.execute_query(query)
+            results = self._execute_query(query, arraysize=limit)
             
             # Process the initial results
             details = []
@@ -923,7 +1404,7 @@ class TableValidator:
                     """
                     
                     # Execute the query to get the column values
-                    value_results = self.target_db.execute_query(value_query)
+                    value_results = self._execute_query(value_query, arraysize=1)
                     
                     # Add the detail with the correct column values
                     if value_results:
@@ -1002,7 +1483,7 @@ class TableValidator:
         try:
             # Execute the query
             logger.debug(f"Executing missing row details query: {query[:500]}...")
-            results = self.target_db.execute_query(query)
+            results = self._execute_query(query, arraysize=limit)
             
             # Format the results
             details = []
@@ -1026,71 +1507,83 @@ class TableValidator:
     def _count_extra_in_target(self, source_table: str, target_table: str,
                               natural_keys: List[str],
                               incremental_mode: bool = False,
-                              incremental_column: Optional[str] = None) -> Union[int, Tuple[int, List[Dict]]]:
-        """Count rows that exist in target but not in source and optionally return details."""
+                              incremental_column: Optional[str] = None,
+                              snapshot_table: Optional[str] = None) -> Tuple[int, List[Dict]]:
+        """Count rows that exist in target but not in source, with details if they are stored.
+        
+        If snapshot_table is given the source keys are read from it instead of over the link.
+        """
         logger.debug(f"Counting extra rows in target table {target_table} not in source {source_table}")
         
         # Since we're now querying from target, we need to change the approach
         # The "extra in target" are now rows in target that don't exist in source@dblink
-        key_conditions = " AND ".join([f"t.{key} = s.{key}" for key in natural_keys])
         
         # Apply incremental filter if enabled
-        incremental_condition = self._get_incremental_condition(source_table, incremental_mode, incremental_column, for_extra_target=True)
-        
-        # If we don't need details, just return the count
-        if not (hasattr(self, 'config') and self.config.store_mismatch_details):
-            query = f"""
-            SELECT COUNT(*) as cnt
-            FROM {target_table} t
-            WHERE NOT EXISTS (
-                SELECT 1 FROM {source_table}@{self.db_link_name} s
-                WHERE {key_conditions}
-            )
-            {incremental_condition}
+        incremental_condition, binds = self._get_incremental_condition(source_table, incremental_mode, incremental_column, for_extra_target=True)
+        input_sizes = self._bind_input_sizes(binds)
+        
+        if incremental_condition:
+            # Only target rows changed since the last run are checked; if there are none
+            # a cheap existence probe replaces the anti-join over the link
+            probe_query = f"""
+            SELECT CASE WHEN EXISTS (
+                SELECT 1 FROM {target_table} t WHERE 1=1 {incremental_condition}
+            ) THEN 1 ELSE 0 END as changed
+            FROM DUAL
             """
-            
-            # Execute from target database
-            result = self.target_db.execute_query(query)
-            return result[0]['CNT']
-            
-        # We need both count and details
-        # First, get the count
-        count_query = f"""
-        SELECT COUNT(*) as cnt
-        FROM {target_table} t
-        WHERE NOT EXISTS (
-            SELECT 1 FROM {source_table}@{self.db_link_name} s
-            WHERE {key_conditions}
-        )
-        {incremental_condition}
-        """
+            if not self._execute_query(probe_query, binds, arraysize=1, input_sizes=input_sizes)[0]['CHANGED']:
+                logger.debug(f"No rows in {target_table} changed since the last validation, skipping extra row check")
+                return 0, []
         
-        count_result = self.target_db.execute_query(count_query)
+        anti_join = self._extra_in_target_anti_join(
+            source_table, target_table, natural_keys, incremental_condition, snapshot_table
+        )
+        count_query = f"SELECT {EXTRA_IN_TARGET_HINT} COUNT(*) as cnt {anti_join}"
+        count_result = self._execute_query(count_query, binds, arraysize=1, input_sizes=input_sizes)
         count = count_result[0]['CNT']
         
         # If there are no extra rows or we don't need to capture details, return just the count
-        if count == 0 or not self.config.store_mismatch_details:
-            return count
+        if count == 0 or not (hasattr(self, 'config') and self.config.store_mismatch_details):
+            return count, []
         
-        # Now get the details up to the maximum limit
+        return count, self._get_extra_in_target_details(anti_join, natural_keys, binds, input_sizes)
+    
+    def _extra_in_target_anti_join(self, source_table: str, target_table: str,
+                                   natural_keys: List[str], incremental_condition: str = "",
+                                   snapshot_table: Optional[str] = None) -> str:
+        """Build the FROM/WHERE clause selecting target rows with no source row."""
+        # Outer join against only the source key columns, so Oracle can hash anti-join
+        # at the target and pull the remote key set across the link once instead of
+        # probing it per target row
+        key_conditions = " AND ".join([f"t.{key} = s.{key}" for key in natural_keys])
+        return f"""
+        FROM {target_table} t
+        LEFT JOIN (
+            SELECT {", ".join(natural_keys)} FROM {snapshot_table or f"{source_table}@{self.db_link_name}"}
+        ) s ON {key_conditions}
+        WHERE s.{natural_keys[0]} IS NULL
+        {incremental_condition}
+        """
+    
+    def _get_extra_in_target_details(self, anti_join: str, natural_keys: List[str],
+                                     binds: Optional[Dict] = None,
+                                     input_sizes: Optional[Dict] = None) -> List[Dict]:
+        """Fetch up to max_mismatch_details rows matched by an extra-in-target anti-join."""
         # Format the natural keys as a JSON-like string
-        # Create a JSON-like representation of keys
         key_expr = " || ',' || ".join([f"'{key}:' || t.{key}" for key in natural_keys])
         
         detail_query = f"""
-        SELECT {", ".join([f"t.{key}" for key in natural_keys])},
+        SELECT {EXTRA_IN_TARGET_HINT} {", ".join([f"t.{key}" for key in natural_keys])},
                '{{' || {key_expr} || '}}' as key_json
-        FROM {target_table} t
-        WHERE NOT EXISTS (
-            SELECT 1 FROM {source_table}@{self.db_link_name} s
-            WHERE {key_conditions}
-        )
-        {incremental_condition}
-        FETCH FIRST {self.config.max_mismatch_details} ROWS ONLY
+        {anti_join}
+        FETCH FIRST :max_details ROWS ONLY
         """
         
         # Execute from target database to get details
-        detail_results = self.target_db.execute_query(detail_query)
+        detail_results = self._execute_query(
+            detail_query, {**(binds or {}), "max_details": self.config.max_mismatch_details},
+            arraysize=self.config.max_mismatch_details, input_sizes=input_sizes
+        )
         
         # Format the details
         details = []
@@ -1103,4 +1596,4 @@ class TableValidator:
                 "target_value": None
             })
         
-        return count, details
\ No newline at end of file
+        return details
\ No newline at end of file
@@ -1,7 +1,7 @@
 import pytest
 from datetime import time
 from src.data_validator.config import (
-    DatabaseConfig, EmailConfig, TableMapping, 
+    DatabaseConfig, TableMapping, 
     RunWindow, ValidationConfig
 )
 
@@ -73,4 +73,5 @@ def test_validation_config():
     
     assert config.db_link_name == "TEST_LINK"
     assert len(config.table_mappings) == 1
-    assert config.max_concurrent_validations == 5  # default value
\ No newline at end of file
+    assert config.max_concurrent_validations == 5  # default value
+    assert config.fetch_array_size == 2000  # default value
\ No newline at end of file
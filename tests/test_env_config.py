@@ -1,6 +1,6 @@
 import os
 import pytest
-from src.data_validator.config import DatabaseConfig, EmailConfig, ValidationConfig
+from src.data_validator.config import DatabaseConfig, ValidationConfig
 
 
 def test_database_config_env_expansion(monkeypatch):
@@ -26,28 +26,6 @@ def test_database_config_env_expansion(monkeypatch):
     assert config.service_name == "test_service"
 
 
-def test_email_config_env_expansion(monkeypatch):
-    """Test that environment variables are expanded in email config."""
-    # Set environment variables
-    monkeypatch.setenv("TEST_SMTP_USER", "test@example.com")
-    monkeypatch.setenv("TEST_SMTP_PASS", "test_smtp_password")
-    
-    # Create config with environment variable references
-    config = EmailConfig(
-        enabled=True,
-        smtp_username="${TEST_SMTP_USER}",
-        smtp_password="${TEST_SMTP_PASS}",
-        from_address="${TEST_SMTP_USER}",
-        to_addresses=["${TEST_SMTP_USER}", "admin@example.com"]
-    )
-    
-    # Verify values were expanded
-    assert config.smtp_username == "test@example.com"
-    assert config.smtp_password == "test_smtp_password"
-    assert config.from_address == "test@example.com"
-    assert config.to_addresses == ["test@example.com", "admin@example.com"]
-
-
 def test_non_env_values_unchanged():
     """Test that non-environment variable values are not changed."""
     config = DatabaseConfig(
@@ -0,0 +1,36 @@
+from src.data_validator.utils import result_cache
+from src.data_validator.utils.result_cache import ResultCache
+
+
+def test_hit_requires_matching_signature():
+    cache = ResultCache(ttl_seconds=60)
+    cache.put("CUSTOMERS", (10, "2024-01-01"), "result")
+    
+    assert cache.get("CUSTOMERS", (10, "2024-01-01")) == "result"
+    assert cache.get("CUSTOMERS", (11, "2024-01-01")) is None
+    # A mismatch drops the entry
+    assert cache.get("CUSTOMERS", (10, "2024-01-01")) is None
+
+
+def test_entries_expire(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(result_cache.time, "monotonic", lambda: now[0])
+    cache = ResultCache(ttl_seconds=60)
+    cache.put("CUSTOMERS", 1, "result")
+    
+    now[0] += 30
+    assert cache.get("CUSTOMERS", 1) == "result"
+    now[0] += 31
+    assert cache.get("CUSTOMERS", 1) is None
+
+
+def test_least_recently_used_entry_evicted():
+    cache = ResultCache(ttl_seconds=60, max_entries=2)
+    cache.put("A", 1, "a")
+    cache.put("B", 1, "b")
+    cache.get("A", 1)
+    cache.put("C", 1, "c")
+    
+    assert cache.get("B", 1) is None
+    assert cache.get("A", 1) == "a"
+    assert cache.get("C", 1) == "c"
@@ -1,6 +1,7 @@
 import pytest
 from datetime import datetime, time
 from src.data_validator.config import RunWindow
+from src.data_validator.utils import window_checker
 from src.data_validator.utils.window_checker import WindowChecker
 
 
@@ -8,6 +9,19 @@ def test_no_window_configured():
     checker = WindowChecker(None)
     assert checker.is_within_window() is True
     assert checker.seconds_until_window_opens() == 0
+    assert checker.is_within_window(datetime(2023, 1, 1, 3, 0)) is True
+    assert checker.seconds_until_window_opens(datetime(2023, 1, 1, 3, 0)) == 0
+
+
+def test_run_window_days_mask():
+    window = RunWindow(
+        start_time=time(22, 0),
+        end_time=time(6, 0),
+        days_of_week=[0, 2, 6]
+    )
+    
+    assert window.days_mask == 0b1000101
+    assert RunWindow(start_time=time(0, 0), end_time=time(1, 0)).days_mask == 0b1111111
 
 
 def test_within_window():
@@ -71,4 +85,58 @@ def test_window_crosses_midnight():
     
     # Test at 3 AM (outside window)
     test_time_outside = datetime(2024, 1, 16, 3, 0)
-    assert checker.is_within_window(test_time_outside) is False
\ No newline at end of file
+    assert checker.is_within_window(test_time_outside) is False
+
+def test_current_time_check_cached_per_second(monkeypatch):
+    window = RunWindow(
+        start_time=time(0, 0),
+        end_time=time(23, 59, 59),
+        days_of_week=list(range(7))
+    )
+    checker = WindowChecker(window)
+    calls = []
+    check_time = WindowChecker._check_time
+    monkeypatch.setattr(WindowChecker, "_check_time", lambda self, t: calls.append(t) or check_time(self, t))
+    
+    monkeypatch.setattr(window_checker.time_module, "time", lambda: 1_700_000_000.2)
+    assert checker.is_within_window() is True
+    monkeypatch.setattr(window_checker.time_module, "time", lambda: 1_700_000_000.9)
+    assert checker.is_within_window() is True
+    # Calls within the same second reuse one evaluation
+    assert len(calls) == 1
+    
+    monkeypatch.setattr(window_checker.time_module, "time", lambda: 1_700_000_001.0)
+    assert checker.is_within_window() is True
+    assert len(calls) == 2
+
+
+def test_seconds_until_window_opens():
+    window = RunWindow(
+        start_time=time(22, 0),
+        end_time=time(23, 0),
+        days_of_week=[2, 4]  # Wednesday and Friday
+    )
+    checker = WindowChecker(window)
+    
+    # Monday noon: next window is Wednesday 10 PM
+    assert checker.seconds_until_window_opens(datetime(2024, 1, 15, 12, 0)) == (2 * 24 + 10) * 3600
+    # Wednesday noon: later the same day
+    assert checker.seconds_until_window_opens(datetime(2024, 1, 17, 12, 0)) == 10 * 3600
+    # Wednesday after the window: Friday 10 PM
+    assert checker.seconds_until_window_opens(datetime(2024, 1, 17, 23, 30)) == (2 * 24 - 1) * 3600 - 30 * 60
+    # Inside the window
+    assert checker.seconds_until_window_opens(datetime(2024, 1, 17, 22, 30)) == 0
+    # Inside the window, the next opening is Friday 10 PM
+    assert checker.seconds_until_next_window(datetime(2024, 1, 17, 22, 30)) == 2 * 24 * 3600 - 30 * 60
+
+
+def test_seconds_until_window_opens_single_day():
+    window = RunWindow(
+        start_time=time(9, 0),
+        end_time=time(10, 0),
+        days_of_week=[0]  # Monday only
+    )
+    checker = WindowChecker(window)
+    
+    # Monday after the window: next Monday
+    assert checker.seconds_until_window_opens(datetime(2024, 1, 15, 11, 0)) == (7 * 24 - 2) * 3600